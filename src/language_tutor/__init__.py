@@ -1,8 +1,8 @@
 """French Practice AI Application - Language Tutor."""
 
+from ._lazy import lazy_exports
 from .config_manager import ConfigManager
 from .models import AppConfig, Dialogue, DialogueRole
-from .services import AudioService, DialogueService, FileService
 
 __version__ = "0.1.0"
 __all__ = [
@@ -14,3 +14,14 @@ __all__ = [
     "FileService",
     "AudioService",
 ]
+
+# Services pull in heavy SDKs (torch, cloud clients), so they are only
+# imported on first attribute access.
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "DialogueService": ".services",
+        "FileService": ".services",
+        "AudioService": ".services",
+    },
+)
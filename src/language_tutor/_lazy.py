@@ -0,0 +1,21 @@
+"""Lazy package exports, so importing a package skips heavy SDKs."""
+
+from importlib import import_module
+from typing import Any, Callable, Dict
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that imports exported names on use.
+
+    ``exports`` maps each name to the module, relative to ``package``,
+    that defines it.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name in exports:
+            return getattr(import_module(exports[name], package), name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -1,7 +1,6 @@
 """API access package for external services."""
 
-from .llm_client import GeminiClient, LLMClient, OpenAIClient
-from .tts_client import AzureTTSClient, GoogleCloudTTSClient, TTSClient
+from .._lazy import lazy_exports
 
 __all__ = [
     "LLMClient",
@@ -11,3 +10,17 @@ __all__ = [
     "GoogleCloudTTSClient",
     "AzureTTSClient",
 ]
+
+# LLM and TTS clients depend on different SDKs, so each is imported only
+# when first requested.
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "LLMClient": ".llm_client",
+        "OpenAIClient": ".llm_client",
+        "GeminiClient": ".llm_client",
+        "TTSClient": ".tts_client",
+        "GoogleCloudTTSClient": ".tts_client",
+        "AzureTTSClient": ".tts_client",
+    },
+)
@@ -9,6 +9,9 @@ import openai
 
 from ..models.dialogue import Dialogue, DialogueMessage, DialogueRole
 
+# Number of most recent messages sent as context when continuing a dialogue
+HISTORY_WINDOW = 6
+
 
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
@@ -39,6 +42,7 @@ class OpenAIClient(LLMClient):
         """Initialize the OpenAI client."""
         self.client = openai.AsyncOpenAI(api_key=api_key)
         self.model = model
+        self.model_name = model
 
     async def generate_dialogue(
         self,
@@ -100,7 +104,7 @@ Le dialogue doit être naturel et approprié pour le niveau {level}."""
         ]
 
         # Add dialogue history
-        for msg in dialogue.messages[-6:]:  # Last 6 messages for context
+        for msg in dialogue.messages[-HISTORY_WINDOW:]:
             role = "user" if msg.role == DialogueRole.USER else "assistant"
             messages.append({"role": role, "content": msg.content})
 
@@ -178,6 +182,7 @@ class GeminiClient(LLMClient):
         """Initialize the Gemini client."""
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(model)
+        self.model_name = model
 
     async def generate_dialogue(
         self,
@@ -228,7 +233,7 @@ Le dialogue doit être naturel et approprié pour le niveau {level}."""
 
         # Build conversation context
         conversation_history = ""
-        for msg in dialogue.messages[-6:]:  # Last 6 messages for context
+        for msg in dialogue.messages[-HISTORY_WINDOW:]:
             speaker = (
                 "Utilisateur" if msg.role == DialogueRole.USER else "Assistant"
             )
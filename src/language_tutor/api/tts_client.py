@@ -1,25 +1,52 @@
 """TTS client implementations for audio generation."""
 
 import asyncio
+import base64
+import functools
+import hashlib
+import io
+import logging
 import os
+import re
 import tempfile
+import threading
+import unicodedata
+import wave
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import azure.cognitiveservices.speech as speechsdk
-import torch
-import torchaudio
 from google.cloud import texttospeech
-from whisperspeech.pipeline import Pipeline
+
+from ..disk_cache import DiskCache
+
+if TYPE_CHECKING:
+    import torch
 
 # Add gTTS import
 try:
+    import requests
     from gtts import gTTS
+    from gtts.tts import gTTSError
 
     GTTS_AVAILABLE = True
 except ImportError:
     GTTS_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class TTSClient(ABC):
     """Abstract base class for TTS clients."""
@@ -34,11 +61,25 @@ class TTSClient(ABC):
         """Synthesize speech from text and return audio bytes."""
         pass
 
+    async def stream_speech(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        language_code: str = "fr-FR",
+    ) -> AsyncIterator[bytes]:
+        """Yield audio bytes as they are synthesized.
+
+        Providers without incremental output yield the whole clip at once.
+        """
+        yield await self.synthesize_speech(
+            text=text, voice_name=voice_name, language_code=language_code
+        )
+
     @abstractmethod
     async def get_available_voices(
         self, language_code: str = "fr-FR"
-    ) -> List[str]:
-        """Get list of available voices for the specified language."""
+    ) -> Tuple[str, ...]:
+        """Get the available voices for the specified language."""
         pass
 
 
@@ -50,6 +91,7 @@ class GoogleCloudTTSClient(TTSClient):
         if credentials_path:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
         self.client = texttospeech.TextToSpeechClient()
+        self._voices: Dict[str, Tuple[str, ...]] = {}
 
     async def synthesize_speech(
         self,
@@ -95,18 +137,25 @@ class GoogleCloudTTSClient(TTSClient):
 
     async def get_available_voices(
         self, language_code: str = "fr-FR"
-    ) -> List[str]:
-        """Get available French voices from Google Cloud TTS."""
+    ) -> Tuple[str, ...]:
+        """Get available French voices from Google Cloud TTS.
+
+        The list is fetched once per language and then reused.
+        """
+        if language_code in self._voices:
+            return self._voices[language_code]
+
         try:
             response = await asyncio.get_event_loop().run_in_executor(
                 None, self.client.list_voices, {"language_code": language_code}
             )
 
-            voices = []
-            for voice in response.voices:
-                if language_code in voice.language_codes:
-                    voices.append(voice.name)
-
+            voices = tuple(
+                voice.name
+                for voice in response.voices
+                if language_code in voice.language_codes
+            )
+            self._voices[language_code] = voices
             return voices
 
         except Exception as e:
@@ -126,6 +175,7 @@ class AzureTTSClient(TTSClient):
         self.speech_config.speech_synthesis_output_format = (
             speechsdk.SpeechSynthesisOutputFormat.Audio16Khz32KBitRateMonoMp3
         )
+        self._voices: Dict[str, Tuple[str, ...]] = {}
 
     async def synthesize_speech(
         self,
@@ -174,8 +224,14 @@ class AzureTTSClient(TTSClient):
 
     async def get_available_voices(
         self, language_code: str = "fr-FR"
-    ) -> List[str]:
-        """Get available French voices from Azure TTS."""
+    ) -> Tuple[str, ...]:
+        """Get available French voices from Azure TTS.
+
+        The list is fetched once per language and then reused.
+        """
+        if language_code in self._voices:
+            return self._voices[language_code]
+
         synthesizer = speechsdk.SpeechSynthesizer(
             speech_config=self.speech_config, audio_config=None
         )
@@ -185,33 +241,124 @@ class AzureTTSClient(TTSClient):
                 None, synthesizer.get_voices_async().get
             )
 
-            voices = []
-            for voice in result.voices:
-                if language_code.lower() in voice.locale.lower():
-                    voices.append(voice.short_name)
-
+            voices = tuple(
+                voice.short_name
+                for voice in result.voices
+                if language_code.lower() in voice.locale.lower()
+            )
+            self._voices[language_code] = voices
             return voices
 
         except Exception as e:
             raise Exception(f"Error getting available voices: {str(e)}")
 
 
+# WhisperSpeech pipelines aren't safe to share between threads, so every
+# model call from any client runs on this one worker
+_WHISPERSPEECH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="whisperspeech"
+)
+
+
+# Title abbreviations (and single initials) whose period doesn't end a
+# sentence, e.g. "M. Dupont" or "Dr. Martin"
+_ABBREVIATIONS = (
+    "[A-Z]",
+    "MM",
+    "Mme",
+    "Mmes",
+    "Mlle",
+    "Mlles",
+    "Dr",
+    "Pr",
+    "St",
+)
+
+# Sentence boundaries WhisperSpeech output is streamed on
+_SENTENCE_END = re.compile(
+    "".join(rf"(?<!\b{abbreviation}\.)" for abbreviation in _ABBREVIATIONS)
+    + r"(?<=[.!?…])\s+"
+)
+
+
+@functools.lru_cache(maxsize=2)
+def _load_whisperspeech_pipeline(s2a_ref: str, quantization: str = "none"):
+    """Load a WhisperSpeech pipeline once per process and model."""
+    # whisperspeech pulls in torch and initializes CUDA, so it is only
+    # imported once a WhisperSpeech voice is actually needed
+    from whisperspeech.pipeline import Pipeline
+
+    pipeline = Pipeline(s2a_ref=s2a_ref)
+    if quantization != "none":
+        _quantize_pipeline(pipeline, quantization)
+    return pipeline
+
+
+def _quantize_pipeline(pipeline, quantization: str) -> None:
+    """Reduce the precision of the T2S and S2A models in place.
+
+    ``Pipeline`` has already run each model's ``optimize()``, which casts
+    the weights and the kv-cache buffers to fp16, so dtype changes go
+    through the models' own ``switch_dtypes`` to keep them consistent.
+
+    ``int8`` swaps linear layers for dynamically quantized ones, which only
+    run on CPU; ``bf16`` is only applied on GPU. Models on the other kind
+    of device are left unchanged, with a warning.
+    """
+    import torch
+
+    for name in ("t2s", "s2a"):
+        model = getattr(pipeline, name)
+        on_gpu = next(model.parameters()).is_cuda
+        if quantization == "int8" and not on_gpu:
+            # Dynamic quantization expects fp32 weights and activations
+            model.switch_dtypes(torch.float32)
+            setattr(
+                pipeline,
+                name,
+                torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                ),
+            )
+        elif quantization == "bf16" and on_gpu:
+            model.switch_dtypes(torch.bfloat16)
+        else:
+            logger.warning(
+                "WhisperSpeech %s quantization is not supported on %s; "
+                "keeping the %s model unquantized",
+                quantization,
+                "GPU" if on_gpu else "CPU",
+                name,
+            )
+
+
 class WhisperSpeechTTSClient(TTSClient):
     """WhisperSpeech TTS client for high-quality open-source TTS."""
 
-    def __init__(self, model_ref: Optional[str] = None):
+    def __init__(
+        self, model_ref: Optional[str] = None, quantization: str = "none"
+    ):
         """Initialize the WhisperSpeech TTS client."""
         self.pipeline = None
         self.sample_rate = 24000  # WhisperSpeech default sample rate
         self.model_ref = (
             model_ref or "collabora/whisperspeech:s2a-q4-tiny-en+pl.model"
         )
+        self.quantization = quantization
+        # Concurrent requests for the same text share a single pending
+        # generation
+        self._pending: Dict[str, "asyncio.Future[bytes]"] = {}
 
     def _get_pipeline(self):
-        """Lazy initialization of WhisperSpeech pipeline."""
+        """Lazy initialization of WhisperSpeech pipeline.
+
+        The pipeline is shared with every other client using the same
+        model, so new AudioService instances don't reload the weights.
+        """
         if self.pipeline is None:
-            # Initialize with the configured model
-            self.pipeline = Pipeline(s2a_ref=self.model_ref)
+            self.pipeline = _load_whisperspeech_pipeline(
+                self.model_ref, self.quantization
+            )
         return self.pipeline
 
     async def synthesize_speech(
@@ -222,52 +369,197 @@ class WhisperSpeechTTSClient(TTSClient):
     ) -> bytes:
         """Synthesize speech using WhisperSpeech."""
         try:
-            # Get pipeline
-            pipeline = self._get_pipeline()
-
-            # Generate audio
-            audio_tensor = await asyncio.get_event_loop().run_in_executor(
-                None, pipeline.generate, text
-            )
-
-            # Convert to bytes (WAV format)
-            # Create a temporary file to save the audio
-            with tempfile.NamedTemporaryFile(
-                suffix=".wav", delete=False
-            ) as tmp_file:
-                # Save as WAV file
-                torchaudio.save(
-                    tmp_file.name, audio_tensor.unsqueeze(0), self.sample_rate
+            loop = asyncio.get_event_loop()
+            pending = self._pending.get(text)
+            if pending is None or pending.get_loop() is not loop:
+                pending = loop.run_in_executor(
+                    _WHISPERSPEECH_EXECUTOR, self._generate_wav, text
                 )
+                self._pending[text] = pending
 
-                # Read the file back as bytes
-                with open(tmp_file.name, "rb") as f:
-                    audio_bytes = f.read()
+                def forget(done: "asyncio.Future[bytes]") -> None:
+                    if self._pending.get(text) is done:
+                        del self._pending[text]
 
-                # Clean up temporary file
-                os.unlink(tmp_file.name)
+                pending.add_done_callback(forget)
 
-                return audio_bytes
+            # Shield the shared generation so one caller being cancelled
+            # doesn't cancel it for the others
+            return await asyncio.shield(pending)
 
         except Exception as e:
             raise Exception(
                 f"Error synthesizing speech with WhisperSpeech: {str(e)}"
             )
 
+    async def stream_pcm(self, text: str) -> AsyncIterator[bytes]:
+        """Yield 16-bit mono PCM one sentence at a time.
+
+        Each sentence is written out as soon as it has been generated, so
+        long texts never hold the whole waveform in memory.
+        """
+        loop = asyncio.get_event_loop()
+        for sentence in _SENTENCE_END.split(text.strip()):
+            if sentence.strip():
+                yield await loop.run_in_executor(
+                    _WHISPERSPEECH_EXECUTOR, self._generate_pcm, sentence
+                )
+
+    def _generate_pcm(self, text: str) -> bytes:
+        """Load the pipeline if needed and synthesize text to PCM bytes."""
+        audio_tensor = self._get_pipeline().generate(text)
+        return self._to_pcm(audio_tensor)
+
+    def _generate_wav(self, text: str) -> bytes:
+        """Synthesize text to WAV bytes in memory.
+
+        The whole waveform is written as a single frame block, instead of
+        saving to a temporary file and reading it back.
+        """
+        buffer = io.BytesIO()
+        with self.open_wav(buffer) as wav_file:
+            wav_file.writeframes(self._generate_pcm(text))
+        return buffer.getvalue()
+
+    def open_wav(self, file: BinaryIO) -> "wave.Wave_write":
+        """Open a WAV writer matching the PCM this client produces."""
+        wav_file = wave.open(file, "wb")
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(self.sample_rate)
+        return wav_file
+
+    @staticmethod
+    def _to_pcm(audio_tensor: "torch.Tensor") -> bytes:
+        """Convert a float waveform to 16-bit PCM in one tensor op."""
+        import torch
+
+        return (
+            (audio_tensor.detach().flatten().clamp(-1.0, 1.0) * 32767)
+            .to(torch.int16)
+            .cpu()
+            .numpy()
+            .tobytes()
+        )
+
     async def get_available_voices(
         self, language_code: str = "fr-FR"
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """Get available voices for WhisperSpeech."""
         # WhisperSpeech supports voice cloning but doesn't have
         # predefined voice names like cloud services
         # For now, return a default voice identifier
-        return ["whisperspeech-default"]
+        return ("whisperspeech-default",)
+
+
+# Bump when the gTTS request settings change, so audio cached by older
+# versions is not reused
+GTTS_CACHE_VERSION = 1
+
+# Clips kept in memory per client, in front of the on-disk cache
+GTTS_MEMORY_CACHE_SIZE = 32
+
+
+# gTTS language and slow flag for each role-based voice name
+_GTTS_VOICES: Dict[str, Tuple[str, bool]] = {
+    "user": ("fr", False),  # Normal speed
+    "assistant": ("fr", True),  # Slower voice
+    "default": ("fr", False),
+}
+_GTTS_VOICE_NAMES = tuple(_GTTS_VOICES)
+
+
+# Each gTTS response line carries one part's MP3, base64-encoded
+_GTTS_AUDIO = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+if GTTS_AVAILABLE:
+
+    class _PooledGTTS(gTTS):
+        """gTTS that sends its part requests over a reused session.
+
+        Stock gTTS opens a new ``requests.Session``, and so a new TLS
+        connection, for every ~100-character part of every call.
+
+        gTTS has no public way to pass in a session: ``gTTS.stream`` builds
+        its own around the request loop. ``stream`` therefore mirrors it on
+        top of the private ``_prepare_requests``, which builds the signed
+        request for each part. The gTTS dependency is pinned to a minor
+        release so a change to that helper can't slip in unnoticed.
+        """
+
+        def __init__(
+            self,
+            *args,
+            session: Callable[[], "requests.Session"],
+            **kwargs,
+        ):
+            super().__init__(*args, **kwargs)
+            # Called per request, so each part uses the session of the
+            # thread it is fetched on
+            self.session = session
+
+        def stream(self) -> Iterator[bytes]:
+            """Request each text part and yield its MP3 bytes."""
+            for prepared in self._prepare_requests():
+                session = self.session()
+                # send() skips the environment's proxy and CA bundle
+                # settings, so merge them in as Session.request would
+                settings = session.merge_environment_settings(
+                    prepared.url, {}, None, None, None
+                )
+                try:
+                    response = session.send(
+                        prepared, timeout=self.timeout, **settings
+                    )
+                    response.raise_for_status()
+                except requests.exceptions.HTTPError:
+                    raise gTTSError(tts=self, response=response)
+                except requests.exceptions.RequestException:
+                    raise gTTSError(tts=self)
+
+                for line in response.iter_lines(chunk_size=1024):
+                    decoded_line = line.decode("utf-8")
+                    if "jQ1olc" in decoded_line:
+                        audio_search = _GTTS_AUDIO.search(decoded_line)
+                        if not audio_search:
+                            raise gTTSError(tts=self, response=response)
+                        yield base64.b64decode(
+                            audio_search.group(1).encode("ascii")
+                        )
 
 
 # New gTTS client class
 class GTTSClient(TTSClient):
     """Google Text-to-Speech (gTTS) client."""
 
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Initialize the gTTS client; ``cache_dir`` enables audio caching."""
+        self.cache = DiskCache(cache_dir, ".mp3")
+        # One keep-alive connection pool per worker thread, since
+        # requests.Session isn't documented as thread-safe
+        self._local = threading.local()
+        self._sessions: List["requests.Session"] = []
+        self._sessions_lock = threading.Lock()
+        # Recently synthesized clips, oldest first
+        self._memory_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    def _session(self) -> "requests.Session":
+        """Return the calling thread's HTTP session, creating it once."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close the client's pooled HTTP connections."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
     async def synthesize_speech(
         self,
         text: str,
@@ -276,66 +568,178 @@ class GTTSClient(TTSClient):
     ) -> bytes:
         """Synthesize speech using gTTS."""
         try:
-            # Map voice names to different speech settings for variety
-            voice_config = {
-                "user": {"lang": "fr", "slow": False},  # Normal speed
-                "assistant": {"lang": "fr", "slow": True},  # Slower voice
-                "default": {"lang": "fr", "slow": False},
-            }
-
-            # Select configuration based on voice_name
-            if voice_name and voice_name.lower() in voice_config:
-                config = voice_config[voice_name.lower()]
-                lang_code = config["lang"]
-                is_slow = config["slow"]
-            else:
-                # Extract language code from language_code parameter
-                lang_code = (
-                    language_code.split("-")[0]
-                    if "-" in language_code
-                    else "fr"
-                )
-                is_slow = False
-
-            # Use gTTS to generate speech with selected configuration
-            tts = gTTS(text=text, lang=lang_code, slow=is_slow)
+            lang_code, is_slow = self._voice_settings(
+                voice_name, language_code
+            )
 
-            # Create a temporary file path
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix=".mp3", delete=False
+            # gTTS makes blocking HTTP requests, so run it in a thread to
+            # let concurrent synthesis calls overlap
+            return await asyncio.get_event_loop().run_in_executor(
+                None, self._synthesize_cached, text, lang_code, is_slow
             )
-            temp_path = temp_file.name
-            temp_file.close()  # Close the file handle immediately
 
-            try:
-                # Save gTTS audio to the temporary file
-                tts.save(temp_path)
+        except Exception as e:
+            raise Exception(f"Error synthesizing speech with gTTS: {str(e)}")
 
-                # Read the file back as bytes
-                with open(temp_path, "rb") as f:
-                    audio_bytes = f.read()
+    @staticmethod
+    def _voice_settings(
+        voice_name: Optional[str], language_code: str
+    ) -> Tuple[str, bool]:
+        """Return the gTTS language and slow flag for a voice name."""
+        if voice_name:
+            settings = _GTTS_VOICES.get(voice_name.lower())
+            if settings:
+                return settings
+
+        # Extract language code from language_code parameter
+        lang_code = (
+            language_code.split("-")[0] if "-" in language_code else "fr"
+        )
+        return lang_code, False
 
-                return audio_bytes
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_path)
-                except (OSError, PermissionError):
-                    pass  # Ignore cleanup errors
+    async def stream_speech(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        language_code: str = "fr-FR",
+    ) -> AsyncIterator[bytes]:
+        """Yield MP3 bytes for each text part gTTS requests.
+
+        gTTS splits long text into parts of about 100 characters and makes
+        one request per part, so the first part can be played while the
+        rest are still being fetched.
+        """
+        try:
+            lang_code, is_slow = self._voice_settings(
+                voice_name, language_code
+            )
+            memory_key = self._memory_key(text, lang_code, is_slow)
+            cached = self._recall(memory_key)
+            if cached is not None:
+                yield cached
+                return
+
+            loop = asyncio.get_event_loop()
+            cache_key = self._cache_key(text, lang_code, is_slow)
+            cached = await loop.run_in_executor(
+                None, self.cache.read, cache_key
+            )
+            if cached is not None:
+                self._remember(memory_key, cached)
+                yield cached
+                return
+
+            parts = _PooledGTTS(
+                text=text, lang=lang_code, slow=is_slow, session=self._session
+            ).stream()
+
+            # Each next() blocks on an HTTP request, so pull parts in a
+            # thread
+            chunks = []
+            while True:
+                chunk = await loop.run_in_executor(None, next, parts, None)
+                if chunk is None:
+                    break
+                chunks.append(chunk)
+                yield chunk
+
+            audio_bytes = b"".join(chunks)
+            self._remember(memory_key, audio_bytes)
+            await loop.run_in_executor(
+                None, self.cache.write, cache_key, audio_bytes
+            )
 
         except Exception as e:
-            raise Exception(f"Error synthesizing speech with gTTS: {str(e)}")
+            raise Exception(f"Error streaming speech with gTTS: {str(e)}")
+
+    def _synthesize_cached(
+        self, text: str, lang_code: str, is_slow: bool
+    ) -> bytes:
+        """Return cached MP3 bytes for the request, synthesizing on a miss."""
+        memory_key = self._memory_key(text, lang_code, is_slow)
+        audio_bytes = self._recall(memory_key)
+        if audio_bytes is not None:
+            return audio_bytes
+
+        cache_key = self._cache_key(text, lang_code, is_slow)
+        audio_bytes = self.cache.read(cache_key)
+        if audio_bytes is None:
+            audio_bytes = self._synthesize(text, lang_code, is_slow)
+            self.cache.write(cache_key, audio_bytes)
+        self._remember(memory_key, audio_bytes)
+        return audio_bytes
+
+    @staticmethod
+    def _memory_key(text: str, lang_code: str, is_slow: bool) -> bytes:
+        """Build a short in-memory cache key for the exact request text."""
+        # blake2b is much cheaper than SHA-256 on short strings, and the
+        # key never leaves the process
+        return hashlib.blake2b(
+            text.encode("utf-8"),
+            digest_size=16,
+            key=f"{lang_code}|{is_slow}".encode("utf-8"),
+        ).digest()
+
+    def _recall(self, memory_key: bytes) -> Optional[bytes]:
+        """Return audio from the in-memory cache, or None on a miss."""
+        with self._memory_lock:
+            audio_bytes = self._memory_cache.get(memory_key)
+            if audio_bytes is not None:
+                self._memory_cache.move_to_end(memory_key)
+            return audio_bytes
+
+    def _remember(self, memory_key: bytes, audio_bytes: bytes) -> None:
+        """Keep audio in memory, evicting the least recently used clip."""
+        if not audio_bytes:
+            return
+
+        with self._memory_lock:
+            self._memory_cache[memory_key] = audio_bytes
+            self._memory_cache.move_to_end(memory_key)
+            if len(self._memory_cache) > GTTS_MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+
+    @staticmethod
+    def _cache_key(text: str, lang_code: str, is_slow: bool) -> str:
+        """Build a cache key from the normalized text and voice settings."""
+        normalized = unicodedata.normalize("NFC", text.strip())
+        payload = f"{GTTS_CACHE_VERSION}|{lang_code}|{is_slow}|{normalized}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _synthesize(self, text: str, lang_code: str, is_slow: bool) -> bytes:
+        """Run gTTS synchronously and return the MP3 bytes."""
+        # Use gTTS to generate speech with selected configuration
+        tts = _PooledGTTS(
+            text=text, lang=lang_code, slow=is_slow, session=self._session
+        )
+
+        # Create a temporary file path
+        temp_file = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
+        temp_path = temp_file.name
+        temp_file.close()  # Close the file handle immediately
+
+        try:
+            # Save gTTS audio to the temporary file
+            tts.save(temp_path)
+
+            # Read the file back as bytes
+            with open(temp_path, "rb") as f:
+                audio_bytes = f.read()
+
+            return audio_bytes
+        finally:
+            # Clean up temporary file
+            try:
+                os.unlink(temp_path)
+            except (OSError, PermissionError):
+                pass  # Ignore cleanup errors
 
     async def get_available_voices(
         self, language_code: str = "fr-FR"
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """Get available voices for gTTS."""
-        # Return role-based voice options that map to different accents
-        return [
-            "user",  # Maps to standard French (fr)
-            "assistant",  # Maps to Canadian French (fr-CA)
-            "default",  # Maps to standard French (fr)
-        ]
+        # Role-based voice options, each mapped to its own speech settings
+        return _GTTS_VOICE_NAMES
 
 
 async def save_audio_file(audio_data: bytes, filename: str) -> str:
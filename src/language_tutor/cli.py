@@ -44,8 +44,7 @@ def setup_config():
 def validate_config():
     """Validate the current configuration."""
     try:
-        config = config_manager.load_config()
-        config_manager.validate_config(config)
+        config = config_manager.get_validated_config()
         print("✅ Configuration is valid!")
         print(f"LLM Provider: {config.llm_provider.value}")
         print(f"TTS Provider: {config.tts_provider.value}")
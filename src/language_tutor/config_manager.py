@@ -5,7 +5,12 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
-from .models.config import AppConfig, LLMProvider, TTSProvider
+from .models.config import (
+    AppConfig,
+    LLMProvider,
+    TTSProvider,
+    TTSQuantization,
+)
 
 
 class ConfigManager:
@@ -17,6 +22,19 @@ class ConfigManager:
             load_dotenv(env_file)
         else:
             load_dotenv()  # Load from .env file in current directory
+        self._validated_config: Optional[AppConfig] = None
+
+    def get_validated_config(self) -> AppConfig:
+        """Load and validate the configuration once, then reuse it.
+
+        Raises the same errors as ``validate_config``; a failed validation
+        is not cached, so the next call tries again.
+        """
+        if self._validated_config is None:
+            config = self.load_config()
+            self.validate_config(config)
+            self._validated_config = config
+        return self._validated_config
 
     def load_config(self) -> AppConfig:
         """Load configuration from environment variables."""
@@ -40,6 +58,13 @@ class ConfigManager:
                 "LANG_TUTOR_WHISPERSPEECH_MODEL",
                 "collabora/whisperspeech:s2a-q4-tiny-en+pl.model",
             ),
+            tts_quantization=TTSQuantization(
+                os.getenv("LANG_TUTOR_TTS_QUANTIZATION", "none")
+            ),
+            # LLM Response Cache (off unless a directory is set)
+            llm_cache_dir=os.getenv("LANG_TUTOR_LLM_CACHE_DIR") or None,
+            # gTTS Audio Cache (off unless a directory is set)
+            tts_cache_dir=os.getenv("LANG_TUTOR_TTS_CACHE_DIR") or None,
             # General Settings
             max_dialogue_length=int(
                 os.getenv("LANG_TUTOR_MAX_DIALOGUE_LENGTH", "10")
@@ -50,6 +75,8 @@ class ConfigManager:
             audio_output_format=os.getenv(
                 "LANG_TUTOR_AUDIO_OUTPUT_FORMAT", "mp3"
             ),
+            debug=os.getenv("LANG_TUTOR_DEBUG", "false").lower()
+            in ("1", "true", "yes"),
             # Performance Settings
             request_timeout=int(os.getenv("LANG_TUTOR_REQUEST_TIMEOUT", "30")),
             max_concurrent_requests=int(
@@ -103,10 +130,21 @@ LANG_TUTOR_GOOGLE_CLOUD_CREDENTIALS_PATH=path/to/credentials.json
 LANG_TUTOR_AZURE_SPEECH_KEY=your_azure_speech_key_here
 LANG_TUTOR_AZURE_SPEECH_REGION=your_azure_region_here
 
+# WhisperSpeech Configuration
+LANG_TUTOR_TTS_QUANTIZATION=none  # Options: none, int8 (CPU), bf16 (GPU)
+
+# LLM Response Cache (set a directory to replay identical requests)
+# LANG_TUTOR_LLM_CACHE_DIR=~/.cache/language-tutor/dialogues
+
+# gTTS Audio Cache (set a directory to reuse synthesized audio; entries
+# are never evicted)
+# LANG_TUTOR_TTS_CACHE_DIR=~/.cache/language-tutor/tts
+
 # General Settings
 LANG_TUTOR_MAX_DIALOGUE_LENGTH=10
 LANG_TUTOR_DEFAULT_VOICE_GENDER=female
 LANG_TUTOR_AUDIO_OUTPUT_FORMAT=mp3
+LANG_TUTOR_DEBUG=false
 
 # Performance Settings
 LANG_TUTOR_REQUEST_TIMEOUT=30
@@ -0,0 +1,59 @@
+"""On-disk cache shared by the LLM and TTS services."""
+
+import os
+import tempfile
+from typing import Optional
+
+
+class DiskCache:
+    """Cache entries stored as one file per key in a directory.
+
+    Cache failures never break the caller: an unreadable entry counts as a
+    miss and a failed write is dropped.
+    """
+
+    def __init__(self, directory: Optional[str], suffix: str):
+        """Store entries under ``directory``; ``None`` disables the cache."""
+        self.directory = os.path.expanduser(directory) if directory else None
+        self.suffix = suffix
+
+    def _path(self, key: str) -> str:
+        """Return the file path of a cache entry."""
+        return os.path.join(self.directory, f"{key}{self.suffix}")
+
+    def read(self, key: str) -> Optional[bytes]:
+        """Read a cache entry, or None on a miss."""
+        if not self.directory:
+            return None
+
+        try:
+            with open(self._path(key), "rb") as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def write(self, key: str, data: bytes) -> None:
+        """Store a cache entry atomically.
+
+        Each write gets its own temporary file in the cache directory, so
+        concurrent writers (threads or processes) never see partial entries.
+        """
+        if not self.directory or not data:
+            return
+
+        temp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as file:
+                temp_path = file.name
+                file.write(data)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            # Ignore cache write errors, but don't leave the temp file behind
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
@@ -22,6 +22,14 @@ class TTSProvider(str, Enum):
     GTTS = "gtts"
 
 
+class TTSQuantization(str, Enum):
+    """Weight formats for local TTS models."""
+
+    NONE = "none"
+    INT8 = "int8"  # Dynamic int8 linear layers, CPU only
+    BF16 = "bf16"  # bfloat16 weights, GPU only
+
+
 class AppConfig(BaseModel):
     """Application configuration model."""  # LLM Configuration
 
@@ -38,6 +46,22 @@ class AppConfig(BaseModel):
         default="collabora/whisperspeech:s2a-q4-tiny-en+pl.model",
         description="WhisperSpeech model to use",
     )
+    tts_quantization: TTSQuantization = Field(
+        default=TTSQuantization.NONE,
+        description="Quantize WhisperSpeech weights after loading",
+    )
+
+    # LLM Response Cache (opt-in: cached dialogues are replayed verbatim)
+    llm_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for cached LLM responses (None disables)",
+    )
+
+    # gTTS Audio Cache
+    tts_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for cached gTTS audio (None disables)",
+    )
 
     # General Settings
     max_dialogue_length: int = Field(
@@ -50,6 +74,10 @@ class AppConfig(BaseModel):
         default="mp3", description="Audio output format"
     )
 
+    debug: bool = Field(
+        default=False, description="Show error tracebacks in the UI"
+    )
+
     # Performance Settings
     request_timeout: int = Field(
         default=30, description="API request timeout in seconds"
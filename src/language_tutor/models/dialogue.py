@@ -2,11 +2,17 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
+from hashlib import blake2b
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
 
+# Supported difficulty levels, easiest first
+DIFFICULTY_LEVELS = ("beginner", "intermediate", "advanced")
+
+
 class DialogueRole(str, Enum):
     """Dialogue participant roles."""
 
@@ -25,6 +31,13 @@ class DialogueMessage(BaseModel):
         default=None, description="Path to generated audio file"
     )
 
+    @cached_property
+    def content_key(self) -> str:
+        """Short stable hash of the role and content, for widget keys."""
+        return blake2b(
+            (self.role.value + self.content).encode("utf-8"), digest_size=8
+        ).hexdigest()
+
 
 class Dialogue(BaseModel):
     """A complete dialogue conversation."""
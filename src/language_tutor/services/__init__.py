@@ -1,7 +1,16 @@
 """Services package for business logic and file processing."""
 
-from .audio_service import AudioService
-from .dialogue_service import DialogueService
-from .file_service import FileService
+from .._lazy import lazy_exports
 
 __all__ = ["DialogueService", "FileService", "AudioService"]
+
+# Each service module pulls in its own SDKs, so importing one service
+# must not import the others.
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "AudioService": ".audio_service",
+        "DialogueService": ".dialogue_service",
+        "FileService": ".file_service",
+    },
+)
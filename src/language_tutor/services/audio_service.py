@@ -2,7 +2,8 @@
 
 import asyncio
 import os
-from typing import Any, Dict, List, Optional
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from pydub import AudioSegment
 
@@ -48,11 +49,12 @@ class AudioService:
 
         elif self.config.tts_provider == TTSProvider.WHISPERSPEECH:
             return WhisperSpeechTTSClient(
-                model_ref=self.config.whisperspeech_model
+                model_ref=self.config.whisperspeech_model,
+                quantization=self.config.tts_quantization.value,
             )
 
         elif self.config.tts_provider == TTSProvider.GTTS:
-            return GTTSClient()
+            return GTTSClient(cache_dir=self.config.tts_cache_dir)
 
         else:
             raise ValueError(
@@ -67,18 +69,27 @@ class AudioService:
     ) -> str:
         """Generate audio for a single text and return file path."""
         try:
-            # Synthesize speech
-            audio_data = await self.tts_client.synthesize_speech(
-                text=text, voice_name=voice_name
-            )
-
             # Create filename if not provided
             if not filename:
                 # Create safe filename from text (first 50 chars)
                 safe_text = "".join(
                     c for c in text[:50] if c.isalnum() or c in (" ", "-", "_")
                 ).rstrip()
-                filename = f"{safe_text}.wav"  # Save audio to file
+                filename = f"{safe_text}.wav"
+
+            # WhisperSpeech output is written sentence by sentence as it is
+            # generated rather than after the whole text is synthesized
+            if isinstance(self.tts_client, WhisperSpeechTTSClient):
+                return await self._write_streamed_wav(
+                    self.tts_client, text, filename
+                )
+
+            # Synthesize speech
+            audio_data = await self.tts_client.synthesize_speech(
+                text=text, voice_name=voice_name
+            )
+
+            # Save audio to file
             file_path = await save_audio_file(audio_data, filename)
 
             return file_path
@@ -86,30 +97,85 @@ class AudioService:
         except Exception as e:
             raise Exception(f"Error generating audio: {str(e)}")
 
+    async def _write_streamed_wav(
+        self, client: WhisperSpeechTTSClient, text: str, filename: str
+    ) -> str:
+        """Append WhisperSpeech PCM to a WAV file as each chunk arrives.
+
+        The WAV is streamed into a temporary file that only replaces the
+        target once synthesis finishes, so a failure mid-stream never leaves
+        a truncated file behind.
+        """
+        file_path = os.path.join(self.output_directory, filename)
+        temp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp_path, "wb", buffering=256 * 1024) as file:
+                with client.open_wav(file) as wav_file:
+                    async for pcm in client.stream_pcm(text):
+                        wav_file.writeframesraw(pcm)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return file_path
+
+    async def generate_audio_stream(
+        self, text: str, voice_name: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield audio bytes for a text as the TTS provider produces them."""
+        try:
+            async for chunk in self.tts_client.stream_speech(
+                text=text, voice_name=voice_name
+            ):
+                yield chunk
+        except Exception as e:
+            raise Exception(f"Error streaming audio: {str(e)}")
+
     async def generate_audio_for_dialogue(
         self, dialogue: Dialogue, voice_name: Optional[str] = None
     ) -> Dialogue:
-        """Generate audio for all messages in a dialogue that don't have audio."""
+        """Generate audio for all messages in a dialogue that don't have audio.
+
+        Messages are synthesized concurrently, bounded by the configured
+        ``max_concurrent_requests``.
+        """
         try:
-            # Process each message
-            for i, message in enumerate(dialogue.messages):
-                # Generate audio for all messages (both user and assistant)
-                # since in French learning, both sides speak French
-                if not message.audio_file_path and message.content.strip():
-                    filename = f"dialogue_{dialogue.id}_message_{i}.wav"
+            semaphore = asyncio.Semaphore(
+                max(1, self.config.max_concurrent_requests)
+            )
+            # Dialogue ids are optional and usually unset, so fall back to
+            # a fresh one to keep each dialogue's files apart
+            dialogue_id = dialogue.id or uuid.uuid4().hex
 
-                    # Use different voice names for different speakers
-                    speaker_voice = voice_name or message.role.value
+            async def generate_message_audio(
+                i: int, message: DialogueMessage
+            ) -> None:
+                filename = f"dialogue_{dialogue_id}_message_{i}.wav"
 
-                    # Generate audio for this message with role-specific voice
+                # Use different voice names for different speakers
+                speaker_voice = voice_name or message.role.value
+
+                # Generate audio for this message with role-specific voice
+                async with semaphore:
                     file_path = await self.generate_audio_for_text(
                         text=message.content,
                         voice_name=speaker_voice,
                         filename=filename,
                     )
 
-                    # Update message with audio file path
-                    message.audio_file_path = file_path
+                # Update message with audio file path
+                message.audio_file_path = file_path
+
+            # Generate audio for all messages (both user and assistant)
+            # since in French learning, both sides speak French
+            await asyncio.gather(
+                *(
+                    generate_message_audio(i, message)
+                    for i, message in enumerate(dialogue.messages)
+                    if not message.audio_file_path and message.content.strip()
+                )
+            )
 
             return dialogue
 
@@ -118,8 +184,8 @@ class AudioService:
 
     async def get_available_voices(
         self, language_code: str = "fr-FR"
-    ) -> List[str]:
-        """Get list of available voices for the current TTS provider."""
+    ) -> Tuple[str, ...]:
+        """Get the available voices for the current TTS provider."""
         try:
             return await self.tts_client.get_available_voices(language_code)
         except Exception as e:
@@ -213,11 +279,11 @@ class AudioService:
 
     def get_audio_file_info(self, file_path: str) -> Dict[str, Any]:
         """Get information about an audio file."""
-        if not os.path.exists(file_path):
+        try:
+            file_stats = os.stat(file_path)
+        except FileNotFoundError:
             return {"exists": False}
 
-        file_stats = os.stat(file_path)
-
         return {
             "exists": True,
             "size_bytes": file_stats.st_size,
@@ -242,22 +308,34 @@ class AudioService:
             # First, ensure all messages have audio generated
             await self.generate_audio_for_dialogue(dialogue)
 
+            # Decode all message audio concurrently; each decode shells out
+            # to ffmpeg, so they overlap well in worker threads
+            loop = asyncio.get_event_loop()
+            audio_paths = [
+                message.audio_file_path
+                if message.audio_file_path
+                and os.path.exists(message.audio_file_path)
+                else None
+                for message in dialogue.messages
+            ]
+            audio_segments = await asyncio.gather(
+                *(
+                    loop.run_in_executor(None, AudioSegment.from_file, path)
+                    for path in audio_paths
+                    if path
+                )
+            )
+
             # Create a combined audio segment
             combined_audio = AudioSegment.empty()
             # 0.5 second pause between messages
             silence_between_messages = AudioSegment.silent(duration=500)
 
-            for i, message in enumerate(dialogue.messages):
-                if message.audio_file_path and os.path.exists(
-                    message.audio_file_path
-                ):
-                    # Load the audio segment
-                    audio_segment = AudioSegment.from_file(
-                        message.audio_file_path
-                    )
-
+            segments = iter(audio_segments)
+            for i, path in enumerate(audio_paths):
+                if path:
                     # Add the message audio
-                    combined_audio += audio_segment
+                    combined_audio += next(segments)
 
                     # Add silence between messages (except after last)
                     if i < len(dialogue.messages) - 1:
@@ -267,9 +345,12 @@ class AudioService:
             if not filename.endswith((".mp3", ".wav")):
                 filename = filename + ".mp3"
 
-            # Save the combined audio
+            # Save the combined audio; the MP3 encode shells out to ffmpeg,
+            # so keep it off the shared event loop
             output_path = os.path.join(self.output_directory, filename)
-            combined_audio.export(output_path, format="mp3")
+            await loop.run_in_executor(
+                None, self._export_mp3, combined_audio, output_path
+            )
 
             return output_path
 
@@ -277,3 +358,8 @@ class AudioService:
             raise Exception(
                 f"Error generating complete dialogue audio: {str(e)}"
             )
+
+    @staticmethod
+    def _export_mp3(audio: AudioSegment, output_path: str) -> None:
+        """Encode audio to an MP3 file and close the handle pydub returns."""
+        audio.export(output_path, format="mp3").close()
@@ -1,10 +1,24 @@
 """Service for handling dialogue operations and LLM interactions."""
 
+import hashlib
+import json
+from datetime import datetime
 from typing import Any, Dict, Optional
 
-from ..api.llm_client import GeminiClient, LLMClient, OpenAIClient
+from ..api.llm_client import (
+    HISTORY_WINDOW,
+    GeminiClient,
+    LLMClient,
+    OpenAIClient,
+)
+from ..disk_cache import DiskCache
 from ..models.config import AppConfig, LLMProvider
-from ..models.dialogue import Dialogue
+from ..models.dialogue import DIFFICULTY_LEVELS, Dialogue
+
+
+# Bump when the LLM prompts or response parsing change, so responses cached
+# under the old prompts are no longer served
+LLM_CACHE_VERSION = 1
 
 
 class DialogueService:
@@ -14,6 +28,7 @@ class DialogueService:
         """Initialize the dialogue service with configuration."""
         self.config = config
         self.llm_client = self._create_llm_client()
+        self.cache = DiskCache(config.llm_cache_dir, ".json")
 
     def _create_llm_client(self) -> LLMClient:
         """Create appropriate LLM client based on configuration."""
@@ -43,6 +58,21 @@ class DialogueService:
         if num_exchanges is None:
             num_exchanges = min(self.config.max_dialogue_length, 8)
 
+        cache_key = self._cache_key(
+            "generate_dialogue",
+            {
+                "topic": topic,
+                "context": context,
+                "level": level,
+                "num_exchanges": num_exchanges,
+            },
+        )
+        cached = self.cache.read(cache_key)
+        if cached is not None:
+            dialogue = Dialogue.model_validate_json(cached)
+            dialogue.created_at = datetime.now()
+            return dialogue
+
         try:
             dialogue = await self.llm_client.generate_dialogue(
                 topic=topic,
@@ -50,6 +80,9 @@ class DialogueService:
                 level=level,
                 num_exchanges=num_exchanges,
             )
+            self.cache.write(
+                cache_key, dialogue.model_dump_json().encode("utf-8")
+            )
             return dialogue
 
         except Exception as e:
@@ -59,15 +92,52 @@ class DialogueService:
         self, dialogue: Dialogue, user_input: str
     ) -> str:
         """Continue an existing dialogue with user input."""
+        cache_key = self._cache_key(
+            "continue_dialogue",
+            {
+                "level": dialogue.level,
+                "context": dialogue.context,
+                # Only the context window reaches the LLM, so hashing the
+                # full history would cost O(n) per turn for no benefit
+                "history": [
+                    [msg.role.value, msg.content]
+                    for msg in dialogue.messages[-HISTORY_WINDOW:]
+                ],
+                "user_input": user_input,
+            },
+        )
+        cached = self.cache.read(cache_key)
+        if cached is not None:
+            return json.loads(cached)["response"]
+
         try:
             response = await self.llm_client.continue_dialogue(
                 dialogue, user_input
             )
-            return response.strip()
+            response = response.strip()
+            self.cache.write(
+                cache_key,
+                json.dumps({"response": response}, ensure_ascii=False).encode(
+                    "utf-8"
+                ),
+            )
+            return response
 
         except Exception as e:
             raise Exception(f"Failed to continue dialogue: {str(e)}")
 
+    def _cache_key(self, operation: str, arguments: Dict[str, Any]) -> str:
+        """Build a cache key from the provider, model and call arguments."""
+        state = {
+            "version": LLM_CACHE_VERSION,
+            "operation": operation,
+            "provider": self.config.llm_provider.value,
+            "model": getattr(self.llm_client, "model_name", None),
+            "arguments": arguments,
+        }
+        serialized = json.dumps(state, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
     def validate_dialogue_parameters(
         self, topic: str, level: str, num_exchanges: int
     ) -> Dict[str, Any]:
@@ -77,7 +147,7 @@ class DialogueService:
         if not topic or not topic.strip():
             errors.append("Topic cannot be empty")
 
-        if level not in ["beginner", "intermediate", "advanced"]:
+        if level not in DIFFICULTY_LEVELS:
             errors.append(
                 "Level must be 'beginner', 'intermediate', or 'advanced'"
             )
@@ -1,15 +1,20 @@
 """Service for handling file operations and dialogue import/export."""
 
 import csv
+import io
 import json
 import os
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 
 import pandas as pd
 
 from ..models.dialogue import Dialogue, DialogueMessage, DialogueRole
 
+# A dialogue source is either a filesystem path or a seekable binary
+# file-like object (e.g. a Streamlit ``UploadedFile``).
+DialogueSource = Union[str, BinaryIO]
+
 
 class FileService:
     """Service for file operations related to dialogues."""
@@ -19,27 +24,29 @@ class FileService:
         self.output_directory = output_directory
         os.makedirs(output_directory, exist_ok=True)
 
-    async def import_dialogue_from_text(self, file_path: str) -> Dialogue:
-        """Import dialogue from a text file."""
+    async def import_dialogue_from_text(
+        self, source: DialogueSource
+    ) -> Dialogue:
+        """Import dialogue from a text file path or file-like object."""
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
+            content = self._read_source(source)
 
             return self._parse_text_dialogue(
-                content, os.path.basename(file_path)
+                content, self._source_name(source)
             )
 
         except Exception as e:
             raise Exception(f"Error importing dialogue from text: {str(e)}")
 
-    async def import_dialogue_from_markdown(self, file_path: str) -> Dialogue:
+    async def import_dialogue_from_markdown(
+        self, source: DialogueSource
+    ) -> Dialogue:
         """Import dialogue from a markdown file with enhanced parsing."""
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
+            content = self._read_source(source)
 
             return self._parse_markdown_dialogue(
-                content, os.path.basename(file_path)
+                content, self._source_name(source)
             )
 
         except Exception as e:
@@ -47,11 +54,12 @@ class FileService:
                 f"Error importing dialogue from markdown: {str(e)}"
             )
 
-    async def import_dialogue_from_json(self, file_path: str) -> Dialogue:
-        """Import dialogue from a JSON file."""
+    async def import_dialogue_from_json(
+        self, source: DialogueSource
+    ) -> Dialogue:
+        """Import dialogue from a JSON file path or file-like object."""
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                data = json.load(file)
+            data = json.loads(self._read_source(source))
 
             # Handle different JSON formats
             if isinstance(data, dict) and "messages" in data:
@@ -72,7 +80,7 @@ class FileService:
             elif isinstance(data, list):
                 # Simple list format
                 dialogue = Dialogue(
-                    title=os.path.basename(file_path), level="beginner"
+                    title=self._source_name(source), level="beginner"
                 )
 
                 for i, content in enumerate(data):
@@ -91,13 +99,17 @@ class FileService:
         except Exception as e:
             raise Exception(f"Error importing dialogue from JSON: {str(e)}")
 
-    async def import_dialogue_from_csv(self, file_path: str) -> Dialogue:
-        """Import dialogue from a CSV file."""
+    async def import_dialogue_from_csv(
+        self, source: DialogueSource
+    ) -> Dialogue:
+        """Import dialogue from a CSV file path or file-like object."""
         try:
-            df = pd.read_csv(file_path, encoding="utf-8")
+            if not isinstance(source, str):
+                source.seek(0)
+            df = pd.read_csv(source, encoding="utf-8")
 
             dialogue = Dialogue(
-                title=os.path.basename(file_path), level="beginner"
+                title=self._source_name(source), level="beginner"
             )
 
             # Handle different CSV formats
@@ -134,6 +146,12 @@ class FileService:
         self, dialogue: Dialogue, filename: Optional[str] = None
     ) -> str:
         """Export dialogue to JSON file."""
+        return self.export_dialogue_to_json_sync(dialogue, filename)
+
+    def export_dialogue_to_json_sync(
+        self, dialogue: Dialogue, filename: Optional[str] = None
+    ) -> str:
+        """Export dialogue to JSON file synchronously."""
         try:
             if not filename:
                 filename = f"dialogue_{dialogue.id or 'export'}.json"
@@ -175,6 +193,12 @@ class FileService:
         self, dialogue: Dialogue, filename: Optional[str] = None
     ) -> str:
         """Export dialogue to text file."""
+        return self.export_dialogue_to_text_sync(dialogue, filename)
+
+    def export_dialogue_to_text_sync(
+        self, dialogue: Dialogue, filename: Optional[str] = None
+    ) -> str:
+        """Export dialogue to text file synchronously."""
         try:
             if not filename:
                 filename = f"dialogue_{dialogue.id or 'export'}.txt"
@@ -189,6 +213,28 @@ class FileService:
         except Exception as e:
             raise Exception(f"Error exporting dialogue to text: {str(e)}")
 
+    def _read_source(self, source: DialogueSource) -> str:
+        """Read the full text of a dialogue source as UTF-8."""
+        if isinstance(source, str):
+            with open(source, "r", encoding="utf-8") as file:
+                return file.read()
+
+        # In-memory uploads (BytesIO) are decoded straight from their buffer
+        # rather than copied out with read() first
+        if isinstance(source, io.BytesIO):
+            with source.getbuffer() as buffer:
+                return str(buffer, "utf-8")
+
+        # Uploaded files may already have been consumed on a previous rerun
+        source.seek(0)
+        return source.read().decode("utf-8")
+
+    def _source_name(self, source: DialogueSource) -> str:
+        """Get a display name for a dialogue source."""
+        if isinstance(source, str):
+            return os.path.basename(source)
+        return os.path.basename(getattr(source, "name", "") or "upload")
+
     def _parse_text_dialogue(self, content: str, filename: str) -> Dialogue:
         """Parse text content into a Dialogue object."""
         dialogue = Dialogue(title=filename, level="beginner")
@@ -42,20 +42,15 @@ class STTService:
             str: Recognized text or None if no speech detected
         """
         try:
-            with sr.Microphone() as source:
-                self._calibrate_microphone(source)
-
-                # Listen for audio
-                audio = self.recognizer.listen(
-                    source,
-                    timeout=timeout,
-                    phrase_time_limit=phrase_time_limit,
-                )
-
-            # Run speech recognition in a thread to avoid blocking
+            # Recording and recognition both block, so run them together in
+            # a single worker thread instead of stalling the event loop
             loop = asyncio.get_event_loop()
             text = await loop.run_in_executor(
-                None, self._recognize_speech, audio, language
+                None,
+                self.listen_for_speech_sync,
+                timeout,
+                phrase_time_limit,
+                language,
             )
 
             return text
@@ -65,6 +60,30 @@ class STTService:
         except Exception as e:
             raise Exception(f"Error during speech recognition: {str(e)}")
 
+    def listen_for_speech_sync(
+        self,
+        timeout: int = 5,
+        phrase_time_limit: int = 10,
+        language: str = "fr-FR",
+    ) -> Optional[str]:
+        """
+        Blocking version of listen_for_speech.
+
+        Raises:
+            sr.WaitTimeoutError: If no speech starts within the timeout
+        """
+        with sr.Microphone() as source:
+            self._calibrate_microphone(source)
+
+            # Listen for audio
+            audio = self.recognizer.listen(
+                source,
+                timeout=timeout,
+                phrase_time_limit=phrase_time_limit,
+            )
+
+        return self._recognize_speech(audio, language)
+
     def _recognize_speech(self, audio, language: str) -> Optional[str]:
         """
         Recognize speech from audio data.
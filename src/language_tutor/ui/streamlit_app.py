@@ -1,10 +1,27 @@
 """Streamlit web interface for the French Language Tutor."""
 
 import asyncio
+import functools
+import logging
 import os
+import re
 import sys
-import tempfile
-from typing import Any, Dict, Optional
+import threading
+import traceback
+import unicodedata
+from concurrent.futures import Future
+from hashlib import blake2b
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Coroutine,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import streamlit as st
 
@@ -13,15 +30,170 @@ st.set_page_config(
     page_title="French Language Tutor", page_icon="🇫🇷", layout="wide"
 )
 
-# Add the parent directory to the path to allow imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+# Add the parent directory to the path to allow imports when the app is
+# run as a plain script; skip it if it is already there (e.g. on reruns)
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from language_tutor.config_manager import config_manager
-from language_tutor.models.dialogue import Dialogue, DialogueRole
-from language_tutor.services.audio_service import AudioService
-from language_tutor.services.dialogue_service import DialogueService
-from language_tutor.services.file_service import FileService
-from language_tutor.services.stt_service import STTService
+from language_tutor.models.config import AppConfig
+from language_tutor.models.dialogue import (
+    DIFFICULTY_LEVELS,
+    Dialogue,
+    DialogueMessage,
+    DialogueRole,
+)
+
+if TYPE_CHECKING:
+    from language_tutor.services.audio_service import AudioService
+    from language_tutor.services.dialogue_service import DialogueService
+    from language_tutor.services.file_service import FileService
+    from language_tutor.services.stt_service import STTService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@st.cache_resource(show_spinner="Loading configuration...")
+def get_config() -> AppConfig:
+    """Load and validate the configuration once per server process."""
+    return config_manager.get_validated_config()
+
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Start one event loop in a background thread for the whole process.
+
+    Service coroutines are submitted to this loop instead of creating and
+    tearing down a new loop with ``asyncio.run`` on every rerun, which
+    also lets async clients keep their connections between calls.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(
+        target=loop.run_forever, name="language-tutor-loop", daemon=True
+    ).start()
+    return loop
+
+
+def submit_async(coro: Coroutine[Any, Any, T]) -> "Future[T]":
+    """Start a coroutine on the shared event loop without waiting for it."""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return submit_async(coro).result()
+
+
+# Service modules pull in heavy SDKs (LLM clients, torch, PyAudio), so each
+# one is imported and built on first use and then shared by all sessions.
+
+
+@st.cache_resource(show_spinner="Starting dialogue service...")
+def get_dialogue_service() -> "DialogueService":
+    """Build the dialogue service on first use."""
+    from language_tutor.services.dialogue_service import DialogueService
+
+    return DialogueService(get_config())
+
+
+@st.cache_resource(show_spinner=False)
+def get_file_service() -> "FileService":
+    """Build the file service on first use."""
+    from language_tutor.services.file_service import FileService
+
+    return FileService()
+
+
+@st.cache_resource(show_spinner="Starting audio service...")
+def get_audio_service() -> "AudioService":
+    """Build the audio service on first use."""
+    from language_tutor.services.audio_service import AudioService
+
+    return AudioService(get_config())
+
+
+@st.cache_resource(show_spinner="Starting speech recognition...")
+def get_stt_service() -> "STTService":
+    """Build the speech-to-text service on first use."""
+    from language_tutor.services.stt_service import STTService
+
+    return STTService(get_config())
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_available_voices(tts_provider: str) -> Tuple[str, ...]:
+    """Fetch the voice list for a TTS provider, cached for an hour.
+
+    The provider name is only used as the cache key so that switching
+    providers invalidates the cached list.
+    """
+    return run_async(get_audio_service().get_available_voices())
+
+
+# FileService method names by upload extension and by export format; names
+# rather than functions so the service module can stay lazily imported
+IMPORTERS = {
+    "json": "import_dialogue_from_json",
+    "csv": "import_dialogue_from_csv",
+    "md": "import_dialogue_from_markdown",
+    "txt": "import_dialogue_from_text",
+}
+UPLOAD_TYPES = tuple(IMPORTERS)
+EXPORTERS = {
+    "JSON": "export_dialogue_to_json_sync",
+    "Text": "export_dialogue_to_text_sync",
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def import_dialogue(
+    content_hash: str, file_name: str, _source: BinaryIO
+) -> Dialogue:
+    """Parse an uploaded dialogue file, cached on its name and content.
+
+    Re-uploading the same file returns a copy of the cached dialogue
+    instead of parsing it again. The source itself is excluded from the
+    cache key; ``content_hash`` stands in for it.
+    """
+    file_service = get_file_service()
+
+    # Import dialogue based on file extension, parsing the uploaded
+    # buffer directly instead of via a temporary file
+    file_ext = file_name.split(".")[-1].lower()
+    importer = getattr(
+        file_service, IMPORTERS.get(file_ext, "import_dialogue_from_text")
+    )
+    return run_async(importer(_source))
+
+
+# Main tab labels, in display order
+TAB_LABELS = (
+    "Generate Dialogue",
+    "Import Dialogue",
+    "Practice Mode",
+    "Audio Library",
+)
+
+# Number of trailing messages rendered before older ones are collapsed
+RECENT_MESSAGE_LIMIT = 20
+
+# Speaker labels for the audio library; any other role is the assistant
+SPEAKER_LABELS = {DialogueRole.USER: "👤 User"}
+
+
+@functools.lru_cache(maxsize=256)
+def _slug(title: str) -> str:
+    """Turn a dialogue title into an ASCII, filesystem-safe filename stem."""
+    ascii_title = (
+        unicodedata.normalize("NFKD", title)
+        .encode("ascii", "ignore")
+        .decode("ascii")
+    )
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", ascii_title).strip("_")
+    return slug or "dialogue"
 
 
 class LanguageTutorUI:
@@ -29,22 +201,27 @@ class LanguageTutorUI:
 
     def __init__(self):
         """Initialize the UI."""
-        self.config = None
-        self.dialogue_service = None
-        self.file_service = None
-        self.audio_service = None
-        self.stt_service = None
-        self._initialize_services()
-
-    def _initialize_services(self):
-        """Initialize services with configuration."""
-        self.config = config_manager.load_config()
-        config_manager.validate_config(self.config)
-
-        self.dialogue_service = DialogueService(self.config)
-        self.file_service = FileService()
-        self.audio_service = AudioService(self.config)
-        self.stt_service = STTService(self.config)
+        self.config = get_config()
+
+    @property
+    def dialogue_service(self) -> "DialogueService":
+        """Dialogue service, imported on first use."""
+        return get_dialogue_service()
+
+    @property
+    def file_service(self) -> "FileService":
+        """File service, imported on first use."""
+        return get_file_service()
+
+    @property
+    def audio_service(self) -> "AudioService":
+        """Audio service, imported on first use."""
+        return get_audio_service()
+
+    @property
+    def stt_service(self) -> "STTService":
+        """Speech-to-text service, imported on first use."""
+        return get_stt_service()
 
     def run(self):
         """Run the Streamlit application."""
@@ -57,14 +234,7 @@ class LanguageTutorUI:
         self._render_sidebar()
 
         # Main content area
-        tab1, tab2, tab3, tab4 = st.tabs(
-            [
-                "Generate Dialogue",
-                "Import Dialogue",
-                "Practice Mode",
-                "Audio Library",
-            ]
-        )
+        tab1, tab2, tab3, tab4 = st.tabs(TAB_LABELS)
 
         with tab1:
             self._render_generate_dialogue_tab()
@@ -95,8 +265,8 @@ class LanguageTutorUI:
             with st.sidebar.container():
                 with st.spinner("Loading available voices..."):
                     try:
-                        voices = asyncio.run(
-                            self.audio_service.get_available_voices()
+                        voices = get_available_voices(
+                            self.config.tts_provider.value
                         )
                         st.session_state.available_voices = voices
                         st.sidebar.success(f"Found {len(voices)} voices")
@@ -129,49 +299,53 @@ class LanguageTutorUI:
         """Render the dialogue generation tab."""
         st.header("🤖 Generate New Dialogue")
 
-        col1, col2 = st.columns([2, 1])
+        # Batch the inputs in a form so typing doesn't trigger reruns
+        with st.form("generate_dialogue_form"):
+            col1, col2 = st.columns([2, 1])
 
-        with col1:
-            topic = st.text_input(
-                "Dialogue Topic",
-                placeholder="e.g., Ordering food at a restaurant",
-                help="Enter a topic or scenario for the dialogue",
-            )
+            with col1:
+                topic = st.text_input(
+                    "Dialogue Topic",
+                    placeholder="e.g., Ordering food at a restaurant",
+                    help="Enter a topic or scenario for the dialogue",
+                )
 
-            context = st.text_area(
-                "Additional Context (Optional)",
-                placeholder="e.g., A tourist in Paris wants to order lunch",
-                help="Provide additional context to make the dialogue more specific",
-            )
+                context = st.text_area(
+                    "Additional Context (Optional)",
+                    placeholder="e.g., A tourist in Paris wants to order lunch",
+                    help="Provide additional context to make the dialogue more specific",
+                )
 
-        with col2:
-            level = st.selectbox(
-                "Difficulty Level",
-                options=["beginner", "intermediate", "advanced"],
-                help="Choose the appropriate difficulty level",
-            )
+            with col2:
+                level = st.selectbox(
+                    "Difficulty Level",
+                    options=DIFFICULTY_LEVELS,
+                    help="Choose the appropriate difficulty level",
+                )
 
-            num_exchanges = st.number_input(
-                "Number of Exchanges",
-                min_value=2,
-                max_value=self.config.max_dialogue_length,
-                value=5,
-                help="Number of back-and-forth exchanges in the dialogue",
-            )
+                num_exchanges = st.number_input(
+                    "Number of Exchanges",
+                    min_value=2,
+                    max_value=self.config.max_dialogue_length,
+                    value=5,
+                    help="Number of back-and-forth exchanges in the dialogue",
+                )
 
-        col1, col2, col3 = st.columns([1, 1, 2])
+            col1, col2, col3 = st.columns([1, 1, 2])
 
-        with col1:
-            generate_button = st.button("🚀 Generate Dialogue", type="primary")
+            with col1:
+                generate_button = st.form_submit_button(
+                    "🚀 Generate Dialogue", type="primary"
+                )
 
-        with col2:
-            generate_audio = st.checkbox("Generate Audio", value=True)
+            with col2:
+                generate_audio = st.checkbox("Generate Audio", value=True)
 
         if generate_button and topic:
             with st.spinner("Generating dialogue..."):
                 try:
                     # Generate dialogue
-                    dialogue = asyncio.run(
+                    dialogue = run_async(
                         self.dialogue_service.generate_dialogue(
                             topic=topic,
                             context=context,
@@ -186,7 +360,7 @@ class LanguageTutorUI:
                     # Generate audio if requested
                     if generate_audio:
                         with st.spinner("Generating audio..."):
-                            dialogue = asyncio.run(
+                            dialogue = run_async(
                                 self.audio_service.generate_audio_for_dialogue(
                                     dialogue
                                 )
@@ -209,56 +383,38 @@ class LanguageTutorUI:
         # File upload
         uploaded_file = st.file_uploader(
             "Choose a dialogue file",
-            type=["txt", "json", "csv", "md"],
+            type=UPLOAD_TYPES,
             help="Upload a dialogue file in supported format",
         )
 
         if uploaded_file is not None:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}"
-            ) as tmp_file:
-                tmp_file.write(uploaded_file.read())
-                tmp_path = tmp_file.name
-
             try:
-                # Import dialogue based on file extension
-                file_ext = uploaded_file.name.split(".")[-1].lower()
-
-                with st.spinner("Importing dialogue..."):
-                    if file_ext == "json":
-                        dialogue = asyncio.run(
-                            self.file_service.import_dialogue_from_json(
-                                tmp_path
-                            )
-                        )
-                    elif file_ext == "csv":
-                        dialogue = asyncio.run(
-                            self.file_service.import_dialogue_from_csv(
-                                tmp_path
-                            )
-                        )
-                    elif file_ext == "md":
-                        dialogue = asyncio.run(
-                            self.file_service.import_dialogue_from_markdown(
-                                tmp_path
-                            )
-                        )
-                    else:  # txt
-                        dialogue = asyncio.run(
-                            self.file_service.import_dialogue_from_text(
-                                tmp_path
-                            )
+                # Only parse an upload when it changes; re-importing on every
+                # rerun would replace the dialogue and drop its audio
+                if (
+                    st.session_state.get("imported_file_id")
+                    != uploaded_file.file_id
+                ):
+                    with st.spinner("Importing dialogue..."):
+                        with uploaded_file.getbuffer() as buffer:
+                            content_hash = blake2b(
+                                buffer, digest_size=16
+                            ).hexdigest()
+                        dialogue = import_dialogue(
+                            content_hash, uploaded_file.name, uploaded_file
                         )
 
-                # Store dialogue in session state
-                st.session_state.imported_dialogue = dialogue
-                st.success("Dialogue imported successfully!")
+                    # Store dialogue in session state
+                    st.session_state.imported_dialogue = dialogue
+                    st.session_state.imported_file_id = uploaded_file.file_id
+                    st.success("Dialogue imported successfully!")
+
+                dialogue = st.session_state.imported_dialogue
 
                 # Option to generate audio
                 if st.button("🔊 Generate Audio for Imported Dialogue"):
                     with st.spinner("Generating audio..."):
-                        dialogue = asyncio.run(
+                        dialogue = run_async(
                             self.audio_service.generate_audio_for_dialogue(
                                 dialogue
                             )
@@ -269,53 +425,59 @@ class LanguageTutorUI:
             except Exception as e:
                 st.error(f"Error importing dialogue: {str(e)}")
 
-            finally:
-                # Clean up temporary file
-                os.unlink(tmp_path)
-
         # Display imported dialogue
         if "imported_dialogue" in st.session_state:
             self._display_dialogue(st.session_state.imported_dialogue)
 
+    @st.fragment
     def _render_practice_mode_tab(self):
-        """Render the interactive practice mode tab."""
+        """Render the interactive practice mode tab.
+
+        Runs as a fragment: practice state is local to this tab, so a chat
+        turn only reruns this tab instead of the whole page.
+        """
         st.header("💬 Practice Mode")
         try:
             # Initialize practice dialogue if not exists
             if "practice_dialogue" not in st.session_state:
                 st.session_state.practice_dialogue = None
-                st.session_state.practice_messages = []
 
             # Start new practice session
-            col1, col2 = st.columns([3, 1])
+            with st.form("practice_session_form"):
+                col1, col2 = st.columns([3, 1])
 
-            with col1:
-                practice_topic = st.text_input(
-                    "Practice Topic", placeholder="e.g., Asking for directions"
-                )
+                with col1:
+                    practice_topic = st.text_input(
+                        "Practice Topic",
+                        placeholder="e.g., Asking for directions",
+                    )
 
-            with col2:
-                practice_level = st.selectbox(
-                    "Level",
-                    options=["beginner", "intermediate", "advanced"],
-                    key="practice_level",
+                with col2:
+                    practice_level = st.selectbox(
+                        "Level",
+                        options=DIFFICULTY_LEVELS,
+                        key="practice_level",
+                    )
+
+                start_practice = st.form_submit_button(
+                    "🎯 Start Practice Session"
                 )
 
-            if st.button("🎯 Start Practice Session") and practice_topic:
+            if start_practice and practice_topic:
                 try:
-                    st.write("[DEBUG] Creating Dialogue object...")
                     st.session_state.practice_dialogue = Dialogue(
                         title=practice_topic, level=practice_level
                     )
-                    st.session_state.practice_messages = []
                     st.success(
                         "Practice session started! Type your first message below."
                     )
                 except Exception as e:
                     st.error(f"❌ Failed to start practice session: {str(e)}")
-                    import traceback
-                    st.code(traceback.format_exc())
-                    print("[PracticeMode] Dialogue creation error:", e)
+                    logger.debug(
+                        "Practice dialogue creation failed", exc_info=True
+                    )
+                    if self.config.debug:
+                        st.code(traceback.format_exc())
                     return
 
             # Practice interface
@@ -338,147 +500,127 @@ class LanguageTutorUI:
                     - Use French pronunciation
                     """)
 
-                # Display conversation history
-                for msg in st.session_state.practice_messages:
-                    if msg["role"] == "user":
-                        st.chat_message("user").write(msg["content"])
-                    else:
-                        with st.chat_message("assistant"):
-                            st.write(msg["content"])
-                            if "audio_path" in msg and msg["audio_path"]:
-                                st.audio(msg["audio_path"])
-
-                # --- Robust input processing: use a flag to trigger processing ---
-                if "practice_input_to_process" not in st.session_state:
-                    st.session_state.practice_input_to_process = False
-
-                # If flag is set, process input, clear input and flag, then return
-                if st.session_state.practice_input_to_process:
-                    user_input = st.session_state.practice_text_input
-                    last_user_msg = next((m for m in reversed(st.session_state.practice_messages) if m["role"] == "user"), None)
-                    if user_input and (not last_user_msg or last_user_msg["content"] != user_input):
-                        try:
-                            st.session_state.practice_messages.append({"role": "user", "content": user_input})
-                            st.session_state.practice_dialogue.add_message(DialogueRole.USER, user_input)
-                            with st.spinner("Generating response..."):
-                                try:
-                                    if self.dialogue_service:
-                                        response = asyncio.run(
-                                            self.dialogue_service.continue_dialogue(
-                                                st.session_state.practice_dialogue, user_input
-                                            )
-                                        )
-                                    else:
-                                        response = "Service not available. Please refresh and try again."
-                                    st.session_state.practice_dialogue.add_message(DialogueRole.ASSISTANT, response)
-                                    audio_path = None
-                                    if self.audio_service:
-                                        try:
-                                            audio_path = asyncio.run(
-                                                self.audio_service.create_temporary_audio(response)
-                                            )
-                                        except Exception as audio_e:
-                                            st.warning(f"Could not generate audio: {str(audio_e)}")
-                                    st.session_state.practice_messages.append({
-                                        "role": "assistant",
-                                        "content": response,
-                                        "audio_path": audio_path,
-                                    })
-                                except Exception as dialogue_e:
-                                    st.error(f"Error generating response: {str(dialogue_e)}")
-                                    st.info("💡 Please try again or refresh the page.")
-                        except Exception as input_e:
-                            st.error(f"Error processing input: {str(input_e)}")
-                            st.info("💡 Please try again.")
-                    # Clear input and flag before rerun
-                    st.session_state.practice_text_input = ""
-                    st.session_state.practice_input_to_process = False
-                    st.rerun()
-                    return
-
-                # --- Handle voice input result before rendering widget ---
-                if "practice_voice_result" in st.session_state and st.session_state.practice_voice_result:
-                    st.session_state.practice_text_input = st.session_state.practice_voice_result
-                    st.session_state.practice_input_to_process = True
-                    st.session_state.practice_voice_result = ""
-                    st.rerun()
-                    return
+                # Conversation history is filled in after any new input has
+                # been processed, so the current turn shows without a rerun
+                history = st.container()
 
                 # User input options
                 st.markdown("#### 💬 Your Response")
-                col1, col2 = st.columns([4, 1])
+                voice_text = None
+                col1, col2 = st.columns([1, 1])
                 with col1:
-                    user_input = st.text_input(
-                        "Type your message in French:",
-                        key="practice_text_input",
-                        placeholder="Tapez votre message ici...",
-                    )
-                    # If user presses enter or submits, set flag to process input
-                    if user_input and st.session_state.practice_text_input == user_input and st.session_state.practice_input_to_process is False:
-                        st.session_state.practice_input_to_process = True
-                        st.rerun()
-                        return
-                with col2:
-                    st.markdown("**Or use voice:**")
                     # Microphone test button
                     if st.button(
                         "🔧 Test Mic",
                         key="test_mic_btn",
                         help="Test your microphone",
                     ):
-                        if hasattr(self, "stt_service"):
-                            try:
-                                mic_works, message = (
-                                    self.stt_service.test_microphone()
-                                )
-                                if mic_works:
-                                    st.success(f"🎤 {message}")
-                                else:
-                                    st.error(f"❌ {message}")
-                            except Exception as e:
-                                st.error(f"Microphone test failed: {str(e)}")
-                        else:
-                            st.error("STT service not available")
+                        try:
+                            stt_service = self.stt_service
+                            mic_works, message = stt_service.test_microphone()
+                            if mic_works:
+                                st.success(f"🎤 {message}")
+                            else:
+                                st.error(f"❌ {message}")
+                        except (ImportError, OSError) as e:
+                            st.error(f"STT service not available: {str(e)}")
+                        except Exception as e:
+                            st.error(f"Microphone test failed: {str(e)}")
+                with col2:
                     # Voice record button
                     if st.button(
                         "🎤 Record",
                         key="voice_record_btn",
                         help="Click and speak in French",
                     ):
-                        if hasattr(self, "stt_service"):
-                            with st.spinner("🎧 Listening... Speak now!"):
-                                try:
-                                    voice_text = asyncio.run(
-                                        self.stt_service.listen_for_speech(
-                                            timeout=3,
-                                            phrase_time_limit=10,
-                                            language="fr-FR",
-                                        )
+                        with st.spinner("🎧 Listening... Speak now!"):
+                            try:
+                                stt_service = self.stt_service
+                                voice_text = run_async(
+                                    stt_service.listen_for_speech(
+                                        timeout=3,
+                                        phrase_time_limit=10,
+                                        language="fr-FR",
                                     )
-                                    if voice_text:
-                                        st.success(f"Heard: {voice_text}")
-                                        st.session_state.practice_voice_result = voice_text
-                                        st.rerun()
-                                        return
-                                    else:
-                                        st.warning(
-                                            "No speech detected. Try again."
-                                        )
-                                except Exception as e:
-                                    st.error(f"Speech error: {str(e)}")
-                                    st.info("💡 Make sure your microphone works.")
-                        else:
-                            st.error("Speech recognition not available.")
+                                )
+                                if voice_text:
+                                    st.success(f"Heard: {voice_text}")
+                                else:
+                                    st.warning("No speech detected. Try again.")
+                            except (ImportError, OSError) as e:
+                                st.error(
+                                    f"Speech recognition not available: {str(e)}"
+                                )
+                            except Exception as e:
+                                st.error(f"Speech error: {str(e)}")
+                                st.info("💡 Make sure your microphone works.")
+
+                user_input = (
+                    st.chat_input(
+                        "Tapez votre message ici...", key="practice_chat_input"
+                    )
+                    or voice_text
+                )
+                if user_input:
+                    self._process_practice_input(user_input)
+
+                # Display conversation history
+                practice_dialogue = st.session_state.practice_dialogue
+                existing_audio = self._existing_audio_paths(practice_dialogue)
+                with history:
+                    for message in practice_dialogue.messages:
+                        self._display_message(message, existing_audio)
 
         except Exception as e:
             st.error(f"❌ Practice Mode crashed: {str(e)}")
-            import traceback
-            st.code(traceback.format_exc())
-            print("[PracticeMode] Tab error:", e)
+            logger.debug("Practice Mode tab failed", exc_info=True)
+            if self.config.debug:
+                st.code(traceback.format_exc())
             return
 
+    def _process_practice_input(self, user_input: str):
+        """Send a practice message and record the assistant's reply."""
+        try:
+            practice_dialogue = st.session_state.practice_dialogue
+            practice_dialogue.add_message(DialogueRole.USER, user_input)
+            with st.spinner("Generating response..."):
+                try:
+                    response = run_async(
+                        self.dialogue_service.continue_dialogue(
+                            practice_dialogue, user_input
+                        )
+                    )
+
+                    # Start speech synthesis right away and record the turn
+                    # while it runs
+                    audio_future = submit_async(
+                        self.audio_service.create_temporary_audio(response)
+                    )
+                    practice_dialogue.add_message(
+                        DialogueRole.ASSISTANT, response
+                    )
+                    try:
+                        practice_dialogue.messages[-1].audio_file_path = (
+                            audio_future.result()
+                        )
+                    except Exception as audio_e:
+                        st.warning(
+                            f"Could not generate audio: {str(audio_e)}"
+                        )
+                except Exception as dialogue_e:
+                    st.error(f"Error generating response: {str(dialogue_e)}")
+                    st.info("💡 Please try again or refresh the page.")
+        except Exception as input_e:
+            st.error(f"Error processing input: {str(input_e)}")
+            st.info("💡 Please try again.")
+
+    @st.fragment
     def _render_audio_library_tab(self):
-        """Render the audio library tab."""
+        """Render the audio library tab.
+
+        Runs as a fragment so export and audio generation actions don't
+        rerun the other tabs.
+        """
         st.header("🎵 Audio Library")
 
         # Show audio files for current dialogues
@@ -500,43 +642,72 @@ class LanguageTutorUI:
             )
             return
 
+        # Tab bodies are built on every run even while hidden, so only build
+        # the per-message widgets once the user opens the library
+        if not st.toggle("Show audio library", key="audio_library_open"):
+            return
+
         for dialogue_name, dialogue in dialogues_to_show:
             with st.expander(f"🎤 {dialogue_name}: {dialogue.title}"):
                 st.markdown(f"**Level:** {dialogue.level}")
                 st.markdown(f"**Messages:** {len(dialogue.messages)}")
 
-                # Individual message audio
+                # Long dialogues only show their most recent messages unless
+                # the user asks for the rest
+                first_shown = 0
+                older_count = len(dialogue.messages) - RECENT_MESSAGE_LIMIT
+                if older_count > 0 and not st.toggle(
+                    f"Show earlier {older_count} messages",
+                    key=f"show_all_{dialogue_name}",
+                ):
+                    first_shown = older_count
+
+                existing_audio = self._existing_audio_paths(dialogue)
+
+                # Individual message audio, keyed by content hash so widget
+                # state survives re-imports and reordering
+                seen_keys: Dict[str, int] = {}
                 for i, message in enumerate(dialogue.messages):
+                    occurrence = seen_keys.get(message.content_key, 0)
+                    seen_keys[message.content_key] = occurrence + 1
+                    if i < first_shown:
+                        continue
+
                     col1, col2 = st.columns([3, 1])
 
                     with col1:
-                        speaker = (
-                            "👤 User"
-                            if message.role == DialogueRole.USER
-                            else "🤖 Assistant"
+                        speaker = SPEAKER_LABELS.get(
+                            message.role, "🤖 Assistant"
                         )
                         st.markdown(f"**{speaker}:** {message.content}")
 
                     with col2:
-                        if message.audio_file_path and os.path.exists(
-                            message.audio_file_path
-                        ):
+                        if message.audio_file_path in existing_audio:
                             st.audio(message.audio_file_path)
                         else:
-                            if st.button(
+                            # The button's slot is swapped for the player
+                            # once audio exists, without rerunning the page
+                            slot = st.empty()
+                            if slot.button(
                                 f"🔊 Generate",
-                                key=f"audio_{dialogue_name}_{i}",
+                                key=(
+                                    f"audio_{dialogue_name}_"
+                                    f"{message.content_key}_{occurrence}"
+                                ),
                             ):
                                 with st.spinner("Generating audio..."):
                                     try:
-                                        audio_path = asyncio.run(
+                                        audio_path = run_async(
                                             self.audio_service.generate_audio_for_text(
                                                 message.content,
-                                                filename=f"msg_{i}.mp3",
+                                                filename=(
+                                                    f"{_slug(dialogue_name)}_"
+                                                    f"{message.content_key}.mp3"
+                                                ),
                                             )
                                         )
                                         message.audio_file_path = audio_path
-                                        st.rerun()
+                                        slot.audio(audio_path)
                                     except Exception as e:
                                         st.error(f"Error: {str(e)}")
 
@@ -553,10 +724,10 @@ class LanguageTutorUI:
                             "Generating complete dialogue audio..."
                         ):
                             try:
-                                audio_path = asyncio.run(
+                                audio_path = run_async(
                                     self.audio_service.generate_complete_dialogue_audio(
                                         dialogue,
-                                        filename=f"complete_{dialogue.title.replace(' ', '_')}.mp3",
+                                        filename=f"complete_{_slug(dialogue.title)}.mp3",
                                     )
                                 )
                                 st.success("Complete audio generated!")
@@ -568,30 +739,42 @@ class LanguageTutorUI:
                     # Export options
                     export_format = st.selectbox(
                         "Export Format",
-                        options=["JSON", "Text"],
+                        options=tuple(EXPORTERS),
                         key=f"export_format_{dialogue_name}",
                     )
 
                     if st.button(f"📥 Export", key=f"export_{dialogue_name}"):
                         try:
-                            if export_format == "JSON":
-                                file_path = asyncio.run(
-                                    self.file_service.export_dialogue_to_json(
-                                        dialogue
-                                    )
-                                )
-                            else:
-                                file_path = asyncio.run(
-                                    self.file_service.export_dialogue_to_text(
-                                        dialogue
-                                    )
-                                )
+                            exporter = getattr(
+                                self.file_service, EXPORTERS[export_format]
+                            )
+                            file_path = exporter(dialogue)
 
                             st.success(f"Exported to: {file_path}")
 
                         except Exception as e:
                             st.error(f"Export error: {str(e)}")
 
+    def _existing_audio_paths(self, dialogue: Dialogue) -> Set[str]:
+        """Get the message audio paths that exist on disk.
+
+        Results are cached in the session keyed on the dialogue's audio
+        paths, so reruns don't stat every file again.
+        """
+        paths = tuple(
+            msg.audio_file_path
+            for msg in dialogue.messages
+            if msg.audio_file_path
+        )
+        cache = st.session_state.setdefault("audio_exists_cache", {})
+        existing = cache.get(paths)
+        if existing is None:
+            if len(cache) > 32:
+                cache.clear()
+            existing = {path for path in set(paths) if os.path.exists(path)}
+            cache[paths] = existing
+        return existing
+
     def _display_dialogue(self, dialogue: Dialogue):
         """Display a dialogue in a formatted way."""
         st.markdown("---")
@@ -609,21 +792,30 @@ class LanguageTutorUI:
         # Display messages
         st.markdown("### 💬 Dialogue")
 
-        for i, message in enumerate(dialogue.messages):
-            if message.role == DialogueRole.USER:
-                with st.chat_message("user"):
-                    st.write(message.content)
-                    if message.audio_file_path and os.path.exists(
-                        message.audio_file_path
-                    ):
-                        st.audio(message.audio_file_path)
-            else:
-                with st.chat_message("assistant"):
-                    st.write(message.content)
-                    if message.audio_file_path and os.path.exists(
-                        message.audio_file_path
-                    ):
-                        st.audio(message.audio_file_path)
+        existing_audio = self._existing_audio_paths(dialogue)
+
+        # Keep the most recent messages in view and collapse older ones
+        older_count = len(dialogue.messages) - RECENT_MESSAGE_LIMIT
+        if older_count > 0:
+            with st.expander(f"Earlier {older_count} messages"):
+                for message in dialogue.messages[:older_count]:
+                    self._display_message(message, existing_audio)
+            recent_messages = dialogue.messages[older_count:]
+        else:
+            recent_messages = dialogue.messages
+
+        for message in recent_messages:
+            self._display_message(message, existing_audio)
+
+    def _display_message(
+        self, message: DialogueMessage, existing_audio: Set[str]
+    ):
+        """Display a single dialogue message with its audio, if any."""
+        avatar = "user" if message.role is DialogueRole.USER else "assistant"
+        with st.chat_message(avatar):
+            st.write(message.content)
+            if message.audio_file_path in existing_audio:
+                st.audio(message.audio_file_path)
 
 
 def main():
@@ -0,0 +1,81 @@
+"""Shared pytest fixtures for the Language Tutor test scripts.
+
+Configuration and services are session-scoped so that TTS models and API
+clients are built once for the whole run instead of once per test module,
+and every async test runs on one session-wide event loop.
+"""
+
+import pytest
+import pytest_asyncio
+
+from language_tutor.config_manager import config_manager
+from language_tutor.models.config import AppConfig, TTSProvider
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop.
+
+    The session-scoped services defined below can hold loop-bound state
+    (pending WhisperSpeech generations), so a loop per test would defeat
+    sharing them.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Configuration loaded from the environment and validated.
+
+    Response caches are disabled so every run exercises the real LLM and
+    TTS providers.
+    """
+    return config_manager.get_validated_config().model_copy(
+        update={"llm_cache_dir": None, "tts_cache_dir": None}
+    )
+
+
+@pytest.fixture(scope="session")
+def audio_service(config):
+    """Audio service for the configured TTS provider."""
+    from language_tutor.services.audio_service import AudioService
+
+    return AudioService(config)
+
+
+@pytest.fixture(scope="session")
+def dialogue_service(config):
+    """Dialogue service for the configured LLM provider."""
+    from language_tutor.services.dialogue_service import DialogueService
+
+    return DialogueService(config)
+
+
+@pytest.fixture(scope="session")
+def whisperspeech_config():
+    """Configuration forcing the WhisperSpeech TTS provider."""
+    return AppConfig(
+        tts_provider=TTSProvider.WHISPERSPEECH,
+        llm_cache_dir=None,
+        tts_cache_dir=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def whisperspeech_audio_service(whisperspeech_config):
+    """Audio service backed by WhisperSpeech; loads the model once."""
+    from language_tutor.services.audio_service import AudioService
+
+    return AudioService(whisperspeech_config)
+
+
+@pytest.fixture(scope="session")
+def gtts_client():
+    """gTTS client shared by the gTTS tests, reusing its HTTP sessions."""
+    from language_tutor.api.tts_client import GTTSClient
+
+    client = GTTSClient()
+    yield client
+    client.close()
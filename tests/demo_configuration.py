@@ -4,10 +4,6 @@ Configuration demo script to show .env configuration options for TTS providers.
 """
 
 import os
-import sys
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 
 def demo_configuration():
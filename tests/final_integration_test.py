@@ -3,59 +3,48 @@
 Final integration test to demonstrate WhisperSpeech TTS integration.
 """
 
-import asyncio
-import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+from script_support import run_script
 
 
-async def test_complete_integration():
+async def test_complete_integration(config, audio_service):
     """Test complete WhisperSpeech integration."""
-    try:
-        print("🧪 Running comprehensive WhisperSpeech integration test...")
+    print("🧪 Running comprehensive WhisperSpeech integration test...")
 
-        # Test configuration loading
-        from language_tutor.config_manager import config_manager
+    # Configuration and AudioService come from the shared fixtures
+    print(f"✓ Configuration loaded successfully")
+    print(f"  - LLM Provider: {config.llm_provider.value}")
+    print(f"  - TTS Provider: {config.tts_provider.value}")
+    print(f"  - WhisperSpeech Model: {config.whisperspeech_model}")
 
-        config = config_manager.load_config()
-        print(f"✓ Configuration loaded successfully")
-        print(f"  - LLM Provider: {config.llm_provider.value}")
-        print(f"  - TTS Provider: {config.tts_provider.value}")
-        print(f"  - WhisperSpeech Model: {config.whisperspeech_model}")
+    print("✓ AudioService instantiated successfully with WhisperSpeech")
 
-        # Test AudioService instantiation
-        from language_tutor.services.audio_service import AudioService
+    # Test TTS client creation
+    tts_client = audio_service.tts_client
+    print(f"✓ TTS Client created: {type(tts_client).__name__}")
 
-        audio_service = AudioService(config)
-        print("✓ AudioService instantiated successfully with WhisperSpeech")
+    # Test basic TTS functionality (without actually generating audio)
+    from language_tutor.api.tts_client import WhisperSpeechTTSClient
 
-        # Test TTS client creation
-        tts_client = audio_service.tts_client
-        print(f"✓ TTS Client created: {type(tts_client).__name__}")
-
-        # Test basic TTS functionality (without actually generating audio)
-        from language_tutor.api.tts_client import WhisperSpeechTTSClient
-
-        assert isinstance(tts_client, WhisperSpeechTTSClient)
-        print("✓ Correct TTS client type (WhisperSpeechTTSClient)")
-
-        return True
-
-    except Exception as e:
-        print(f"✗ Integration test failed: {e}")
-        import traceback
-
-        traceback.print_exc()
-        return False
+    assert isinstance(tts_client, WhisperSpeechTTSClient)
+    print("✓ Correct TTS client type (WhisperSpeechTTSClient)")
 
 
 if __name__ == "__main__":
+    from language_tutor.config_manager import config_manager
+    from language_tutor.services.audio_service import AudioService
+
     print("🎯 Final WhisperSpeech Integration Test")
     print("=" * 50)
 
-    success = asyncio.run(test_complete_integration())
+    config = config_manager.get_validated_config()
+    success = run_script(
+        test_complete_integration,
+        config,
+        AudioService(config),
+        failure="✗ Integration test failed",
+    )
 
     if success:
         print("=" * 50)
@@ -0,0 +1,33 @@
+"""Helpers shared by the test modules when they run as scripts."""
+
+import asyncio
+import logging
+import os
+from typing import Any, Callable
+
+# Progress and failure messages; LOGLEVEL chooses how much is shown
+log = logging.getLogger("test_scripts")
+log.setLevel(os.environ.get("LOGLEVEL", "INFO").upper())
+
+
+def run_script(
+    test: Callable[..., Any], *fixtures: Any, failure: str = "✗ Test failed"
+) -> bool:
+    """Run a test function outside pytest and report whether it passed.
+
+    ``fixtures`` are passed to the test in place of the pytest fixtures,
+    and coroutine functions run on a new event loop. A failing test is
+    logged with the ``failure`` prefix instead of raising; the traceback is
+    logged at DEBUG level.
+    """
+    logging.basicConfig(format="%(message)s")
+    try:
+        if asyncio.iscoroutinefunction(test):
+            asyncio.run(test(*fixtures))
+        else:
+            test(*fixtures)
+    except Exception as e:
+        log.error("%s: %s", failure, e)
+        log.debug("Traceback:", exc_info=True)
+        return False
+    return True
@@ -1,10 +1,9 @@
 """Streamlit web interface for the French Language Tutor."""
 
 import asyncio
-import os
-import sys
 import tempfile
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 import streamlit as st
 
@@ -13,9 +12,6 @@ st.set_page_config(
     page_title="French Language Tutor", page_icon="🇫🇷", layout="wide"
 )
 
-# Add the parent directory to the path to allow imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
-
 from language_tutor.config_manager import config_manager
 from language_tutor.models.dialogue import Dialogue, DialogueRole
 from language_tutor.services.audio_service import AudioService
@@ -23,6 +19,34 @@ from language_tutor.services.dialogue_service import DialogueService
 from language_tutor.services.file_service import FileService
 
 
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Start one event loop in a background thread for the whole process."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+
+async def _next_chunk(stream):
+    """Await the next chunk of an audio stream, or None when it ends."""
+    return await anext(stream, None)
+
+
+def _audio_format(chunk: bytes) -> Tuple[str, str]:
+    """Return the file suffix and MIME type for an audio stream's header.
+
+    WhisperSpeech produces WAV; gTTS, Google Cloud and Azure produce MP3.
+    """
+    if chunk.startswith(b"RIFF"):
+        return ".wav", "audio/wav"
+    return ".mp3", "audio/mpeg"
+
+
 class LanguageTutorUI:
     """Main UI class for the Language Tutor application."""
 
@@ -36,12 +60,42 @@ class LanguageTutorUI:
 
     def _initialize_services(self):
         """Initialize services with configuration."""
-        self.config = config_manager.load_config()
-        config_manager.validate_config(self.config)
+        self.config = config_manager.get_validated_config()
         self.dialogue_service = DialogueService(self.config)
         self.file_service = FileService()
         self.audio_service = AudioService(self.config)
 
+    def stream_audio(self, text: str, player) -> str:
+        """Write streamed audio to a temp file and return its path.
+
+        The player is filled in as soon as the first chunk has been
+        written and refreshed with the complete file once the stream ends.
+        """
+        stream = self.audio_service.generate_audio_stream(text)
+        try:
+            chunk = run_async(_next_chunk(stream))
+            if chunk is None:
+                raise ValueError("The TTS provider returned no audio")
+
+            # The first chunk carries the file header, so it decides the
+            # format rather than the configured provider
+            suffix, audio_format = _audio_format(chunk)
+            with tempfile.NamedTemporaryFile(
+                suffix=suffix, delete=False
+            ) as audio_file:
+                audio_file.write(chunk)
+                audio_file.flush()
+                player.audio(audio_file.name, format=audio_format)
+
+                while (chunk := run_async(_next_chunk(stream))) is not None:
+                    audio_file.write(chunk)
+        finally:
+            # Release the provider's stream if synthesis or playback failed
+            run_async(stream.aclose())
+
+        player.audio(audio_file.name, format=audio_format)
+        return audio_file.name
+
     def run(self):
         """Run the Streamlit application."""
         st.title("🇫🇷 French Language Tutor")
@@ -67,16 +121,14 @@ class LanguageTutorUI:
 
         if st.button("🔊 Generate Audio"):
             if test_text:
+                status = st.empty()
+                player = st.empty()
                 with st.spinner("Generating audio..."):
                     try:
-                        # Test audio generation
-                        audio_file = asyncio.run(
-                            self.audio_service.generate_audio_for_text(
-                                test_text
-                            )
-                        )
-                        st.success("Audio generated successfully!")
-                        st.audio(audio_file)
+                        # Stream the audio so playback can start before
+                        # the whole text has been synthesized
+                        self.stream_audio(test_text, player)
+                        status.success("Audio generated successfully!")
                     except Exception as e:
                         st.error(f"Error generating audio: {str(e)}")
             else:
@@ -3,43 +3,33 @@
 Minimal test for WhisperSpeech integration.
 """
 
-import sys
-import os
+from script_support import run_script
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 def test_direct_imports():
     """Test direct imports without triggering __init__ chains."""
-    try:
-        # Test TTS provider enum
-        from language_tutor.models.config import TTSProvider
-        print("✅ TTSProvider imported successfully")
-        print(f"📋 Available providers: {list(TTSProvider)}")
-        print(f"🎯 WhisperSpeech provider: {TTSProvider.WHISPERSPEECH}")
-        
-        # Test WhisperSpeech client directly
-        from language_tutor.api.tts_client import WhisperSpeechTTSClient
-        print("✅ WhisperSpeechTTSClient imported successfully")
-        
-        # Create client instance
-        client = WhisperSpeechTTSClient()
-        print("🎤 WhisperSpeechTTSClient instance created successfully")
-        
-        print("\n🎉 Core WhisperSpeech integration is working!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Import test failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Test TTS provider enum
+    from language_tutor.models.config import TTSProvider
+    print("✅ TTSProvider imported successfully")
+    print(f"📋 Available providers: {list(TTSProvider)}")
+    print(f"🎯 WhisperSpeech provider: {TTSProvider.WHISPERSPEECH}")
+    
+    # Test WhisperSpeech client directly
+    from language_tutor.api.tts_client import WhisperSpeechTTSClient
+    print("✅ WhisperSpeechTTSClient imported successfully")
+    
+    # Create client instance
+    client = WhisperSpeechTTSClient()
+    print("🎤 WhisperSpeechTTSClient instance created successfully")
+    
+    print("\n🎉 Core WhisperSpeech integration is working!")
+
 
 if __name__ == "__main__":
     print("🔍 Testing WhisperSpeech Core Integration...")
     print("=" * 50)
     
-    success = test_direct_imports()
+    success = run_script(test_direct_imports, failure="❌ Import test failed")
     
     print("=" * 50)
     if success:
@@ -3,61 +3,44 @@
 Quick test to verify gTTS is working for French TTS.
 """
 
-import asyncio
-import os
-import tempfile
+import io
+
+from script_support import log, run_script
 
 
 async def test_gtts():
     """Test gTTS with French text."""
-    try:
-        from gtts import gTTS
-
-        print("🧪 Testing gTTS for French TTS...")
-
-        # Test French text
-        text = "Bonjour! Comment allez-vous? Je vais bien, merci."
-
-        # Create gTTS object
-        tts = gTTS(text=text, lang="fr", slow=False)
-
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(
-            suffix=".mp3", delete=False
-        ) as tmp_file:
-            tts.save(tmp_file.name)
-
-            # Check if file was created
-            if os.path.exists(tmp_file.name):
-                file_size = os.path.getsize(tmp_file.name)
-                print(f"✅ gTTS successfully generated French audio!")
-                print(f"   - Text: {text}")
-                print(f"   - File size: {file_size} bytes")
-                print(f"   - Language: French (fr)")
-
-                # Clean up
-                os.unlink(tmp_file.name)
-                return True
-            else:
-                print("❌ Failed to create audio file")
-                return False
-
-    except ImportError as e:
-        print(f"❌ gTTS not available: {e}")
-        return False
-    except Exception as e:
-        print(f"❌ Error testing gTTS: {e}")
-        return False
+    from gtts import gTTS
+
+    log.info("🧪 Testing gTTS for French TTS...")
+
+    # Test French text
+    text = "Bonjour! Comment allez-vous? Je vais bien, merci."
+
+    # Create gTTS object
+    tts = gTTS(text=text, lang="fr", slow=False)
+
+    # Write to an in-memory buffer; only the size is checked
+    buffer = io.BytesIO()
+    tts.write_to_fp(buffer)
+
+    # Check if any audio was written
+    file_size = buffer.tell()
+    assert file_size, "gTTS wrote no audio"
+    log.info("✅ gTTS successfully generated French audio!")
+    log.info("   - Text: %s", text)
+    log.info("   - File size: %d bytes", file_size)
+    log.info("   - Language: French (fr)")
 
 
 if __name__ == "__main__":
-    success = asyncio.run(test_gtts())
+    success = run_script(test_gtts, failure="❌ Error testing gTTS")
 
     if success:
-        print("\n🎉 gTTS is ready for French TTS!")
-        print("✅ No tensor dimension issues")
-        print("✅ Excellent French voice quality")
-        print("✅ Free and reliable")
-        print("\nYou can now use 'gtts' as your TTS provider!")
+        log.info("\n🎉 gTTS is ready for French TTS!")
+        log.info("✅ No tensor dimension issues")
+        log.info("✅ Excellent French voice quality")
+        log.info("✅ Free and reliable")
+        log.info("\nYou can now use 'gtts' as your TTS provider!")
     else:
-        print("\n❌ gTTS test failed")
+        log.error("\n❌ gTTS test failed")
@@ -1,56 +1,42 @@
 #!/usr/bin/env python3
 """Test gTTS integration with proper async handling."""
 
-import asyncio
 import os
 import tempfile
 
-from src.language_tutor.api.tts_client import GTTSClient
+from language_tutor.api.tts_client import GTTSClient
 
+from script_support import log, run_script
 
-async def test_gtts():
+
+async def test_gtts(gtts_client):
     """Test gTTS with French text."""
-    client = GTTSClient()
-
-    try:
-        # Test French text synthesis
-        audio_bytes = await client.synthesize_speech(
-            "Bonjour, comment allez-vous?", language_code="fr"
-        )
-
-        if audio_bytes:
-            print(f"✓ French audio generated successfully")
-            print(f"Audio data size: {len(audio_bytes)} bytes")
-
-            # Test saving to file
-            temp_path = None
-            with tempfile.NamedTemporaryFile(
-                suffix=".mp3", delete=False
-            ) as tmp:
-                temp_path = tmp.name
-                tmp.write(audio_bytes)
-
-            if os.path.exists(temp_path):
-                file_size = os.path.getsize(temp_path)
-                print(f"✓ Audio saved to file: {temp_path}")
-                print(f"File size: {file_size} bytes")
-
-                if file_size > 0:
-                    print("✓ Audio file has content")
-                else:
-                    print("✗ Audio file is empty")
-
-                # Clean up
-                os.unlink(temp_path)
-                print("✓ Temporary file cleaned up")
-            else:
-                print("✗ Audio file was not saved")
-        else:
-            print("✗ No audio data generated")
-
-    except Exception as e:
-        print(f"✗ Error during audio generation: {e}")
+    client = gtts_client
+
+    # Test French text synthesis
+    audio_bytes = await client.synthesize_speech(
+        "Bonjour, comment allez-vous?", language_code="fr"
+    )
+    assert audio_bytes, "No audio data generated"
+    log.info("✓ French audio generated successfully")
+    log.info("Audio data size: %d bytes", len(audio_bytes))
+
+    # Test saving to file; the file is removed when it is closed
+    with tempfile.NamedTemporaryFile(suffix=".mp3") as tmp:
+        tmp.write(audio_bytes)
+        tmp.flush()
+        file_size = os.stat(tmp.name).st_size
+        log.info("✓ Audio saved to file: %s", tmp.name)
+        log.info("File size: %d bytes", file_size)
+
+        assert file_size == len(audio_bytes), "Audio file is incomplete"
+        log.info("✓ Audio file has content")
+
+    log.info("✓ Temporary file cleaned up")
 
 
 if __name__ == "__main__":
-    asyncio.run(test_gtts())
+    success = run_script(
+        test_gtts, GTTSClient(), failure="✗ Error during audio generation"
+    )
+    exit(0 if success else 1)
@@ -2,52 +2,55 @@
 """Test different voices for different speakers."""
 
 import asyncio
-import os
-import sys
 
-# Add the parent directory to the path to allow imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from language_tutor.api.tts_client import GTTSClient
 
-from src.language_tutor.api.tts_client import GTTSClient
+from script_support import log, run_script
 
 
-async def test_different_voices():
+async def test_different_voices(gtts_client):
     """Test different voices for user and assistant."""
-    client = GTTSClient()
-
-    # Test text for both speakers
-    user_text = "Bonjour, comment allez-vous?"
-    assistant_text = "Très bien, merci! Et vous?"
-
-    print("Testing different voices...")
-
-    try:
-        # Test user voice (should use standard French)
-        print("Generating audio for user (standard French)...")
-        user_audio = await client.synthesize_speech(
-            text=user_text, voice_name="user", language_code="fr-FR"
-        )
-        print(f"✓ User audio generated: {len(user_audio)} bytes")
-
-        # Test assistant voice (should use Canadian French)
-        print("Generating audio for assistant (Canadian French)...")
-        assistant_audio = await client.synthesize_speech(
-            text=assistant_text, voice_name="assistant", language_code="fr-FR"
-        )
-        print(f"✓ Assistant audio generated: {len(assistant_audio)} bytes")
-
-        # Test available voices
-        voices = await client.get_available_voices()
-        print(f"✓ Available voices: {voices}")
-
-        if len(user_audio) > 0 and len(assistant_audio) > 0:
-            print("✓ Different voices are working!")
-        else:
-            print("✗ Voice generation failed")
-
-    except Exception as e:
-        print(f"✗ Error testing voices: {e}")
+    client = gtts_client
+
+    # Both speakers say the same text, so any difference comes from the
+    # voice settings
+    text = "Bonjour, comment allez-vous?"
+
+    log.info("Testing different voices...")
+
+    # Synthesize both speakers concurrently; user uses standard French,
+    # assistant the slower voice
+    log.info("Generating audio for user and assistant...")
+    user_audio, assistant_audio = await asyncio.gather(
+        client.synthesize_speech(
+            text=text, voice_name="user", language_code="fr-FR"
+        ),
+        client.synthesize_speech(
+            text=text,
+            voice_name="assistant",
+            language_code="fr-FR",
+        ),
+    )
+    assert user_audio, "No user audio generated"
+    assert assistant_audio, "No assistant audio generated"
+    log.info("✓ User audio generated: %d bytes", len(user_audio))
+    log.info("✓ Assistant audio generated: %d bytes", len(assistant_audio))
+
+    # Test available voices
+    voices = await client.get_available_voices()
+    assert {"user", "assistant"} <= set(voices)
+    log.info("✓ Available voices: %s", voices)
+
+    assert user_audio != assistant_audio, (
+        "User and assistant audio are identical"
+    )
+    log.info("✓ Different voices are working!")
 
 
 if __name__ == "__main__":
-    asyncio.run(test_different_voices())
+    success = run_script(
+        test_different_voices,
+        GTTSClient(),
+        failure="✗ Error testing voices",
+    )
+    exit(0 if success else 1)
@@ -4,32 +4,32 @@ Test script to verify WhisperSpeech integration.
 """
 
 import asyncio
-import sys
 import os
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from language_tutor.models.config import AppConfig, TTSProvider
 from language_tutor.services.audio_service import AudioService
 
+from script_support import log, run_script
+
 
-async def test_whisperspeech():
+async def test_whisperspeech(
+    whisperspeech_config, whisperspeech_audio_service
+):
     """Test WhisperSpeech TTS functionality."""
-    print("🎤 Testing WhisperSpeech TTS Integration...")
-    
-    # Create configuration with WhisperSpeech as default
-    config = AppConfig(tts_provider=TTSProvider.WHISPERSPEECH)
+    log.info("🎤 Testing WhisperSpeech TTS Integration...")
     
-    # Initialize audio service
-    audio_service = AudioService(config)
+    config = whisperspeech_config
+    audio_service = whisperspeech_audio_service
     
-    print(f"✅ Audio service initialized with TTS provider: {config.tts_provider}")
+    log.info("✅ Audio service initialized with TTS provider: %s", config.tts_provider)
     
     # Test text to speech
     test_text = "Bonjour! Je suis votre assistant français pour apprendre la langue."
     
-    print(f"🗣️  Converting text to speech: '{test_text}'")
+    log.info("🗣️  Converting text to speech: '%s'", test_text)
+    
+    # Listing voices doesn't depend on synthesis, so let it run meanwhile
+    voices_task = asyncio.create_task(audio_service.get_available_voices())
     
     try:
         # Generate audio
@@ -37,51 +37,45 @@ async def test_whisperspeech():
             text=test_text,
             filename="test_whisperspeech.wav"
         )
-        
-        print(f"✅ Audio generated successfully!")
-        print(f"📁 Audio file saved to: {audio_file_path}")
-        
-        # Check if file exists and get info
-        if os.path.exists(audio_file_path):
-            file_info = audio_service.get_audio_file_info(audio_file_path)
-            print(f"📊 File size: {file_info['size_mb']} MB")
-            print(f"🎵 WhisperSpeech integration test completed successfully!")
-            
-            # Play audio if possible (optional)
-            print(f"💡 You can play the audio file: {audio_file_path}")
-            
-        else:
-            print("❌ Audio file was not created")
-            
-    except Exception as e:
-        print(f"❌ Error during audio generation: {str(e)}")
-        return False
+    except BaseException:
+        voices_task.cancel()
+        raise
+    
+    log.info("✅ Audio generated successfully!")
+    log.info("📁 Audio file saved to: %s", audio_file_path)
+    
+    # Check if file exists and get info
+    assert os.path.exists(audio_file_path), "Audio file was not created"
+    file_info = audio_service.get_audio_file_info(audio_file_path)
+    assert file_info["size_bytes"] > 0, "Audio file is empty"
+    log.info("📊 File size: %s MB", file_info["size_mb"])
+    log.info("🎵 WhisperSpeech integration test completed successfully!")
     
-    # Test available voices
+    # Play audio if possible (optional)
+    log.info("💡 You can play the audio file: %s", audio_file_path)
+    
+    # Test available voices; listing them is informational only
     try:
-        voices = await audio_service.get_available_voices()
-        print(f"🎭 Available voices: {voices}")
+        voices = await voices_task
+        log.info("🎭 Available voices: %s", voices)
     except Exception as e:
-        print(f"⚠️  Could not get available voices: {str(e)}")
-    
-    return True
+        log.warning("⚠️  Could not get available voices: %s", e)
 
 
-async def main():
-    """Main test function."""
-    print("🚀 Starting WhisperSpeech Integration Test...")
-    print("=" * 50)
-    
-    success = await test_whisperspeech()
+if __name__ == "__main__":
+    # Create configuration with WhisperSpeech as default
+    config = AppConfig(tts_provider=TTSProvider.WHISPERSPEECH)
+    success = run_script(
+        test_whisperspeech,
+        config,
+        AudioService(config),
+        failure="❌ Error during audio generation",
+    )
     
-    print("=" * 50)
+    log.info("=" * 50)
     if success:
-        print("🎉 WhisperSpeech is now successfully integrated as your default TTS!")
-        print("🔧 Configuration: TTS Provider = WhisperSpeech (default)")
-        print("📚 Your language tutor is ready to speak French with WhisperSpeech!")
+        log.info("🎉 WhisperSpeech is now successfully integrated as your default TTS!")
+        log.info("🔧 Configuration: TTS Provider = WhisperSpeech (default)")
+        log.info("📚 Your language tutor is ready to speak French with WhisperSpeech!")
     else:
-        print("💥 Integration test failed. Please check the error messages above.")
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
+        log.error("💥 Integration test failed. Please check the error messages above.")
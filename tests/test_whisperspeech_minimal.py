@@ -3,51 +3,39 @@
 Minimal test to verify WhisperSpeech integration without full app dependencies.
 """
 
-import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+from script_support import run_script
 
 
 def test_whisperspeech_import():
     """Test that WhisperSpeech can be imported and basic functionality works."""
-    try:
-        # Test direct WhisperSpeech import
-        import whisperspeech
+    # Test direct WhisperSpeech import
+    import whisperspeech
 
-        print("✓ WhisperSpeech library imported successfully")
+    print("✓ WhisperSpeech library imported successfully")
 
-        # Test our TTS client import (just the class, not instantiation)
-        from language_tutor.api.tts_client import WhisperSpeechTTSClient
+    # Test our TTS client import (just the class, not instantiation)
+    from language_tutor.api.tts_client import WhisperSpeechTTSClient
 
-        print("✓ WhisperSpeechTTSClient class imported successfully")
+    print("✓ WhisperSpeechTTSClient class imported successfully")
 
-        # Test config imports
-        from language_tutor.models.config import TTSProvider
+    # Test config imports
+    from language_tutor.models.config import TTSProvider
 
-        print("✓ TTSProvider enum imported successfully")
-        print(
-            f"✓ Available TTS providers: {[provider.value for provider in TTSProvider]}"
-        )
+    print("✓ TTSProvider enum imported successfully")
+    print(
+        f"✓ Available TTS providers: {[provider.value for provider in TTSProvider]}"
+    )
 
-        # Test that WhisperSpeech is in the enum
-        assert TTSProvider.WHISPERSPEECH in TTSProvider
-        print("✓ WhisperSpeech is available as a TTS provider option")
-
-        return True
-
-    except ImportError as e:
-        print(f"✗ Import error: {e}")
-        return False
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+    # Test that WhisperSpeech is in the enum
+    assert TTSProvider.WHISPERSPEECH in TTSProvider
+    print("✓ WhisperSpeech is available as a TTS provider option")
 
 
 if __name__ == "__main__":
     print("Testing WhisperSpeech integration (minimal)...")
-    success = test_whisperspeech_import()
+    success = run_script(test_whisperspeech_import, failure="✗ Error")
 
     if success:
         print("\n🎉 WhisperSpeech integration test passed!")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Test WhisperSpeech quantization on stand-in T2S/S2A models."""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from language_tutor.api.tts_client import _quantize_pipeline
+
+
+class FakeModel(torch.nn.Module):
+    """Linear layer plus a kv-cache buffer, like the WhisperSpeech models."""
+
+    def __init__(self):
+        super().__init__()
+        self.linear = torch.nn.Linear(4, 4)
+        self.register_buffer("kv_cache", torch.zeros(2, 4))
+        self.dtype = torch.float32
+
+    def switch_dtypes(self, dtype):
+        # Same conversion as WhisperSpeech's models: leaf layers and buffers
+        self.dtype = dtype
+        for module in self.modules():
+            if isinstance(module, torch.nn.Linear):
+                module.to(dtype)
+            for name, buffer in module.named_buffers(recurse=False):
+                setattr(module, name, buffer.to(dtype))
+
+    def forward(self, x):
+        return self.linear(x.to(self.dtype)) + self.kv_cache[0]
+
+
+def optimized_pipeline(device="cpu"):
+    """A pipeline whose models were cast to fp16 the way optimize() does."""
+    pipeline = SimpleNamespace(t2s=FakeModel(), s2a=FakeModel())
+    for model in (pipeline.t2s, pipeline.s2a):
+        model.to(device)
+        model.switch_dtypes(torch.float16)
+    return pipeline
+
+
+def test_int8_on_cpu():
+    """int8 quantizes the linear layers and restores fp32 buffers."""
+    pipeline = optimized_pipeline()
+    _quantize_pipeline(pipeline, "int8")
+
+    for model in (pipeline.t2s, pipeline.s2a):
+        assert isinstance(
+            model.linear, torch.ao.nn.quantized.dynamic.Linear
+        )
+        assert model.kv_cache.dtype == torch.float32
+        assert model(torch.ones(1, 4)).dtype == torch.float32
+
+
+def test_bf16_on_cpu_warns(caplog):
+    """bf16 is GPU-only, so CPU models are left as they are."""
+    pipeline = optimized_pipeline()
+    with caplog.at_level(logging.WARNING):
+        _quantize_pipeline(pipeline, "bf16")
+
+    assert "not supported on CPU" in caplog.text
+    assert pipeline.t2s.linear.weight.dtype == torch.float16
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="needs CUDA")
+def test_bf16_on_gpu():
+    """bf16 converts weights and kv-cache together."""
+    pipeline = optimized_pipeline("cuda")
+    _quantize_pipeline(pipeline, "bf16")
+
+    for model in (pipeline.t2s, pipeline.s2a):
+        assert model.linear.weight.dtype == torch.bfloat16
+        assert model.kv_cache.dtype == torch.bfloat16
+        assert model(torch.ones(1, 4, device="cuda")).dtype == torch.bfloat16
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="needs CUDA")
+def test_int8_on_gpu_warns(caplog):
+    """Dynamic int8 quantization is CPU-only, so GPU models are kept."""
+    pipeline = optimized_pipeline("cuda")
+    with caplog.at_level(logging.WARNING):
+        _quantize_pipeline(pipeline, "int8")
+
+    assert "not supported on GPU" in caplog.text
+    assert isinstance(pipeline.t2s.linear, torch.nn.Linear)
@@ -3,54 +3,51 @@
 Simple verification that WhisperSpeech is integrated and working.
 """
 
-import asyncio
-import sys
-import os
+from script_support import run_script
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-async def test_basic_integration():
+async def test_basic_integration(
+    whisperspeech_config, whisperspeech_audio_service
+):
     """Test that WhisperSpeech integration works."""
-    try:
-        # Test imports
-        from language_tutor.models.config import AppConfig, TTSProvider
-        from language_tutor.services.audio_service import AudioService
-        
-        print("✅ All imports successful!")
-        
-        # Check that WHISPERSPEECH is available
-        print(f"📋 Available TTS providers: {list(TTSProvider)}")
-        print(f"🎯 Default TTS provider: {TTSProvider.WHISPERSPEECH}")
-        
-        # Create config with WhisperSpeech
-        config = AppConfig(tts_provider=TTSProvider.WHISPERSPEECH)
-        print(f"⚙️  Config created with TTS provider: {config.tts_provider}")
-        
-        # Initialize audio service
-        audio_service = AudioService(config)
-        print("🎤 AudioService initialized successfully!")
-        
-        # Test getting available voices
-        voices = await audio_service.get_available_voices()
-        print(f"🎭 Available voices: {voices}")
-        
-        print("\n🎉 WhisperSpeech integration verified successfully!")
-        print("🚀 Your language tutor is ready to use WhisperSpeech as the default TTS!")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Integration test failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+    from language_tutor.models.config import TTSProvider
+
+    print("✅ All imports successful!")
+    
+    # Check that WHISPERSPEECH is available
+    print(f"📋 Available TTS providers: {list(TTSProvider)}")
+    print(f"🎯 Default TTS provider: {TTSProvider.WHISPERSPEECH}")
+    
+    config = whisperspeech_config
+    assert config.tts_provider == TTSProvider.WHISPERSPEECH
+    print(f"⚙️  Config created with TTS provider: {config.tts_provider}")
+    
+    audio_service = whisperspeech_audio_service
+    print("🎤 AudioService initialized successfully!")
+    
+    # Test getting available voices
+    voices = await audio_service.get_available_voices()
+    assert voices, "WhisperSpeech reported no voices"
+    print(f"🎭 Available voices: {voices}")
+    
+    print("\n🎉 WhisperSpeech integration verified successfully!")
+    print("🚀 Your language tutor is ready to use WhisperSpeech as the default TTS!")
+
 
 if __name__ == "__main__":
+    from language_tutor.models.config import AppConfig, TTSProvider
+    from language_tutor.services.audio_service import AudioService
+
     print("🔍 Verifying WhisperSpeech Integration...")
     print("=" * 50)
     
-    success = asyncio.run(test_basic_integration())
+    config = AppConfig(tts_provider=TTSProvider.WHISPERSPEECH)
+    success = run_script(
+        test_basic_integration,
+        config,
+        AudioService(config),
+        failure="❌ Integration test failed",
+    )
     
     print("=" * 50)
     if success: